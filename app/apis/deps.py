@@ -1,28 +1,172 @@
+import asyncio
 import base64
-from fastapi import HTTPException, Header, Depends
+import functools
+import hashlib
+import secrets
+import time
+from fastapi import HTTPException, Header, Depends, Path, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
-from typing import Optional, Callable
+from typing import Annotated, Any, Optional, Callable
+
+from cachetools import TLRUCache
+from sqlalchemy.orm import Session
 
 from app.core.logging import logger
 from app.core.config import settings
 from app.operations.permission.authorize_user_permission import AuthorizeUserPermissionOperation
-from app.utils.security.jwt import verify_token, verify_vietqr_internal_user
+from app.utils.security.jwt import (
+    decode_token,
+    find_user_by_token_payload,
+    verify_vietqr_internal_user,
+)
+from app.utils.security.session_cache import UserSessionCache
+from app.libs.database import get_db
 from app.libs.mqtt import mqtt_client, MQTTClient
 from app.models.user import User
 
 
-def get_current_user(authorization: Optional[str] = Header(None)) -> Optional[User]:
-    if not authorization:
-        raise HTTPException(status_code=401)
+# Verified tokens are kept for a short while so that repeated requests from
+# the same client skip the signature check and the user lookup. An entry
+# never outlives the token's own `exp` claim. The caches are only touched
+# from the event loop; verification itself runs in the threadpool.
+TOKEN_CACHE_TTL_SECONDS = 30
+TOKEN_CACHE_MAX_SIZE = 10000
+
+
+def _token_cache_ttu(_key: bytes, value: tuple[Any, Optional[int]], now: float) -> float:
+    _, expires_at = value
+    if expires_at is None:
+        return now + TOKEN_CACHE_TTL_SECONDS
+    return min(now + TOKEN_CACHE_TTL_SECONDS, expires_at)
+
+
+class TokenVerificationCache:
+
+    def __init__(self, verifier: Callable[..., tuple[Any, Optional[int]]]):
+        self.verifier = verifier
+        self.cache = TLRUCache(maxsize=TOKEN_CACHE_MAX_SIZE, ttu=_token_cache_ttu, timer=time.time)
+        self._locks: dict[bytes, asyncio.Lock] = {}
+
+    async def get(self, token: str, *args: Any) -> Any:
+        key = hashlib.sha256(token.encode()).digest()
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached[0]
+
+        # Concurrent misses for the same token wait on one verification
+        # instead of each running their own.
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                cached = self.cache.get(key)
+                if cached is not None:
+                    return cached[0]
+
+                result = await run_in_threadpool(self.verifier, token, *args)
+                self.cache[key] = result
+                return result[0]
+        finally:
+            if not lock.locked() and self._locks.get(key) is lock:
+                del self._locks[key]
+
+
+def _verify_user_token(token: str, db: Session) -> tuple[User, Optional[int]]:
+    # Another worker may already have verified this token.
+    cached = UserSessionCache.get(token)
+    if cached is not None:
+        return cached
+
+    payload = decode_token(token)
+    user = find_user_by_token_payload(db, payload)
+    # Detach the user so the cached instance is not tied to this request's
+    # session, which is closed (or rolled back) once the request ends.
+    db.expunge(user)
+    UserSessionCache.set(token, user, payload.get("exp"))
+    return user, payload.get("exp")
 
-    try:
-        scheme, token = authorization.split()
-        if scheme.lower() != "bearer":
+
+def _verify_vietqr_token(token: str) -> tuple[dict, Optional[int]]:
+    payload = verify_vietqr_internal_user(token)
+    return payload, payload.get("exp")
+
+
+_user_token_cache = TokenVerificationCache(_verify_user_token)
+_vietqr_token_cache = TokenVerificationCache(_verify_vietqr_token)
+
+
+@functools.lru_cache(maxsize=1)
+def _vietqr_partner_credentials() -> tuple[bytes, bytes]:
+    return (
+        settings.VIETQR_PARTNER_USERNAME.encode(),
+        settings.VIETQR_PARTNER_PASSWORD.encode(),
+    )
+
+
+def _get_bearer_token(authorization: str) -> Optional[str]:
+    prefix = authorization[:7]
+    if prefix not in ("Bearer ", "bearer ") and prefix.lower() != "bearer ":
+        return None
+    return authorization[7:].strip() or None
+
+
+def _no_session() -> None:
+    return None
+
+
+def _bearer_dependency(
+    token_cache: TokenVerificationCache,
+    state_attr: Optional[str] = None,
+    session_dependency: Optional[Callable] = None,
+) -> Callable:
+    """
+    Build a dependency that resolves the bearer token of a request through
+    `token_cache`. When `state_attr` is set the result is memoised on
+    `request.state`, so it is resolved at most once per request. When
+    `session_dependency` is set, its session is handed to the verifier on a
+    cache miss; FastAPI caches dependencies per request, so this is the same
+    session the route itself receives from `Depends(get_db)`.
+    """
+    async def dependency(
+        request: Request,
+        authorization: Optional[str] = Header(None),
+        db: Optional[Session] = Depends(session_dependency or _no_session),
+    ):
+        if state_attr is not None:
+            resolved = getattr(request.state, state_attr, None)
+            if resolved is not None:
+                return resolved
+
+        if not authorization:
+            raise HTTPException(status_code=401)
+
+        token = _get_bearer_token(authorization)
+        if not token:
+            logger.error("Invalid authorization header format")
+            raise HTTPException(status_code=401)
+
+        try:
+            if db is not None:
+                resolved = await token_cache.get(token, db)
+            else:
+                resolved = await token_cache.get(token)
+        except Exception as e:
+            logger.error("Invalid authorization token", error=e)
             raise HTTPException(status_code=401)
-        return verify_token(token)
-    except Exception as e:
-        logger.error("Invalid authorization header format", error=str(e))
-        raise HTTPException(status_code=401)
+
+        if state_attr is not None:
+            setattr(request.state, state_attr, resolved)
+        return resolved
+
+    return dependency
+
+
+get_current_user = _bearer_dependency(
+    _user_token_cache,
+    state_attr="current_user",
+    session_dependency=get_db,
+)
+get_vietqr_internal_user = _bearer_dependency(_vietqr_token_cache)
 
 
 def verify_vietqr_partner_credentials(credentials: HTTPBasicCredentials = Depends(HTTPBasic())):
@@ -30,11 +174,12 @@ def verify_vietqr_partner_credentials(credentials: HTTPBasicCredentials = Depend
     Verify VietQR partner credentials using Basic Authentication.
     This is used for the token generation endpoint.
     """
-    logger.info(f"Verifying VietQR partner credentials: {credentials.username} {credentials.password}")
-    correct_username = credentials.username == settings.VIETQR_PARTNER_USERNAME
-    correct_password = credentials.password == settings.VIETQR_PARTNER_PASSWORD
-    
-    if not (correct_username and correct_password):
+    username, password = _vietqr_partner_credentials()
+    correct_username = secrets.compare_digest(credentials.username.encode(), username)
+    correct_password = secrets.compare_digest(credentials.password.encode(), password)
+
+    # Bitwise & so both comparisons always run.
+    if not (correct_username & correct_password):
         logger.warning(f"Invalid VietQR partner credentials attempt: {credentials.username}")
         raise HTTPException(
             status_code=401,
@@ -45,24 +190,16 @@ def verify_vietqr_partner_credentials(credentials: HTTPBasicCredentials = Depend
     return credentials
 
 
-def get_vietqr_internal_user(authorization: Optional[str] = Header(None)):
-    if not authorization:
-        raise HTTPException(status_code=401)
-
-    try:
-        scheme, token = authorization.split()
-        if scheme.lower() != "bearer":
-            raise HTTPException(status_code=401)
-        
-        return verify_vietqr_internal_user(token)
-    except Exception as e:
-        logger.error("Invalid authorization header format", error=str(e))
-        raise HTTPException(status_code=401)
+CurrentUser = Annotated[User, Depends(get_current_user)]
 
 
-def get_mqtt_client_dependency() -> MQTTClient:
+async def get_mqtt_client_dependency() -> MQTTClient:
     """
     Dependency to get the MQTT client instance.
+
+    The client is created once when `app.libs.mqtt` is imported, so there is
+    no lazy initialisation to race on. The dependency is async so FastAPI
+    resolves it on the event loop instead of a threadpool worker.
     
     Returns:
         MQTTClient instance
@@ -70,25 +207,27 @@ def get_mqtt_client_dependency() -> MQTTClient:
     Raises:
         HTTPException: If MQTT client is not available
     """
-    try:
-        if not mqtt_client:
-            raise HTTPException(
-                status_code=503,
-                detail="MQTT client not available"
-            )
-        return mqtt_client
-    except Exception as e:
-        logger.error(f"Failed to get MQTT client: {e}")
-        raise HTTPException(
-            status_code=503,
-            detail="MQTT service unavailable"
-        )
+    if not mqtt_client:
+        logger.error("Failed to get MQTT client")
+        raise HTTPException(status_code=503, detail="MQTT service unavailable")
+    return mqtt_client
 
 
 def require_permissions(perms: list[str]) -> Callable[[User], User]:
+    # Built once when the route is declared, not on every request.
+    required_permissions = frozenset(perms)
+
     def dependency(user: User = Depends(get_current_user)):
-        is_authorized = AuthorizeUserPermissionOperation().execute(user, perms)
+        is_authorized = AuthorizeUserPermissionOperation().execute(user, required_permissions)
         if not is_authorized:
             raise HTTPException(status_code=403)
         return user
     return dependency
+
+
+# Checked by the path regex only: the raw string goes straight to Postgres,
+# which parses it, so the request skips building a uuid.UUID and
+# rendering it back to a string for the query.
+UUID_PATTERN = r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+
+UUIDPathParam = Annotated[str, Path(pattern=UUID_PATTERN)]
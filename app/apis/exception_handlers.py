@@ -0,0 +1,29 @@
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.exc import IntegrityError
+
+from app.core.logging import logger
+
+
+async def value_error_handler(_request: Request, exc: ValueError) -> ORJSONResponse:
+    return ORJSONResponse({"detail": str(exc)}, status_code=404)
+
+
+async def permission_error_handler(_request: Request, exc: PermissionError) -> ORJSONResponse:
+    return ORJSONResponse({"detail": str(exc)}, status_code=403)
+
+
+async def integrity_error_handler(request: Request, exc: IntegrityError) -> ORJSONResponse:
+    # str(exc) carries the SQL statement and its parameters; keep it in the logs.
+    logger.error("Integrity error", method=request.method, path=request.url.path, error=exc)
+    return ORJSONResponse({"detail": "Conflict with existing data"}, status_code=400)
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """
+    Map the errors raised by operations to HTTP responses for every route.
+    Routes that need a different mapping still catch those errors locally.
+    """
+    app.add_exception_handler(ValueError, value_error_handler)
+    app.add_exception_handler(PermissionError, permission_error_handler)
+    app.add_exception_handler(IntegrityError, integrity_error_handler)
@@ -22,22 +22,23 @@ from app.apis.v1.user import router as user_router
 
 router = APIRouter()
 
+# Starlette matches routes linearly in registration order, so the routers
+# serving most of the traffic are mounted first.
 router.include_router(auth_router, prefix="/auth", tags=["Authentication"])
-router.include_router(controller_router, prefix="/controller", tags=["Controller"])
-router.include_router(dashboard_router, prefix="/dashboard", tags=["Dashboard"])
-router.include_router(firmware_router, prefix="/firmware", tags=["Firmware"])
-router.include_router(firmware_deployment_router, prefix="/firmware-deployment", tags=["Firmware Deployment"])
+router.include_router(order_router, prefix="/order", tags=["Order"])
+router.include_router(payment_router, prefix="/payment", tags=["Payment"])
 router.include_router(machine_router, prefix="/machine", tags=["Machine"])
+router.include_router(store_router, prefix="/store", tags=["Store"])
+router.include_router(controller_router, prefix="/controller", tags=["Controller"])
 router.include_router(notification_router, prefix="/notification", tags=["Notification"])
+router.include_router(user_router, prefix="/user", tags=["User"])
+router.include_router(vietqr_router, prefix="/vietqr", tags=["VietQR"])
+router.include_router(vnpay_router, prefix="/vnpay", tags=["VNPAY"])
+router.include_router(promotion_campaign_router, prefix="/promotion-campaign", tags=["Promotion Campaign"])
 router.include_router(tenant_router, prefix="/tenant", tags=["Tenant"])
 router.include_router(tenant_member_router, prefix="/tenant-member", tags=["Tenant Member"])
-router.include_router(store_router, prefix="/store", tags=["Store"])
-router.include_router(system_task_router, prefix="/system-task", tags=["System Task"])
-router.include_router(order_router, prefix="/order", tags=["Order"])
-router.include_router(payment_router, prefix="/payment", tags=["Payment"])
 router.include_router(permissions_router, prefix="/permission", tags=["Permissions"])
-router.include_router(promotion_campaign_router, prefix="/promotion-campaign", tags=["Promotion Campaign"])
-router.include_router(vietqr_router, prefix="/vietqr", tags=["VietQR"])
-router.include_router(vnpay_router, prefix="/vnpay", tags=["VNPAY"])
-router.include_router(user_router, prefix="/user", tags=["User"])
-
+router.include_router(system_task_router, prefix="/system-task", tags=["System Task"])
+router.include_router(dashboard_router, prefix="/dashboard", tags=["Dashboard"])
+router.include_router(firmware_router, prefix="/firmware", tags=["Firmware"])
+router.include_router(firmware_deployment_router, prefix="/firmware-deployment", tags=["Firmware Deployment"])
@@ -1,9 +1,12 @@
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.exc import IntegrityError
+import asyncio
 
-from app.apis.deps import get_current_user
+from fastapi import APIRouter, BackgroundTasks, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+
+from app.apis.deps import CurrentUser
 from app.core.logging import logger
-from app.models.user import User
+from app.libs.task_dispatcher import task_dispatcher
 from app.operations.auth.auth_session_operation import AuthSessionOperation
 from app.schemas.auth import (
     RegisterLMSUserRequest,
@@ -15,107 +18,118 @@ from app.schemas.auth import (
     SendOTPRequest,
     VerifyOTPRequest,
 )
+from app.schemas.user import UserSerializer
 from app.operations.auth.register_lms_user_operation import RegisterLMSUserOperation
 from app.operations.auth.sign_in_operation import SignInOperation
 from app.operations.auth.refresh_token_operation import RefreshTokenOperation
 from app.operations.auth.verify_otp_operation import VerifyOTPOperation
 from app.operations.system_task_operation import SystemTaskOperation
-from app.tasks.auth.send_otp_task import send_otp_task
 
 
 router = APIRouter()
 
 
-@router.post("/lms/register")
+@router.post("/lms/register", responses={200: {"model": UserSerializer}})
 async def register(request: RegisterLMSUserRequest):
     try:
-        user = RegisterLMSUserOperation.execute(request)
-        return user.to_dict()
-    except IntegrityError as e:
-        logger.error("User registration failed", error=str(e))
+        user = await run_in_threadpool(RegisterLMSUserOperation.execute, request)
+    except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error("User registration failed", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+    # to_dict() is already JSON-ready; skip FastAPI's jsonable_encoder pass.
+    return ORJSONResponse(user.to_dict())
 
 
 @router.post("/sign-in", response_model=SignInResponse)
-async def sign_in(request: SignInRequest):
+async def sign_in(request: SignInRequest, background_tasks: BackgroundTasks):
     try:
-        await AuthSessionOperation.mark_as_in_progress(request.session_id)
-        user, access_token, refresh_token = await SignInOperation.execute(request)
-        
+        # The session update runs while the password is being checked.
+        mark_as_in_progress = asyncio.create_task(
+            AuthSessionOperation.mark_as_in_progress(request.session_id)
+        )
+        try:
+            user, access_token, refresh_token = await run_in_threadpool(SignInOperation.execute, request)
+        finally:
+            await mark_as_in_progress
+
         await AuthSessionOperation.mark_as_success(user, request.session_id)
         if request.session_id:
-            SystemTaskOperation.mark_as_success(request.session_id)
+            background_tasks.add_task(SystemTaskOperation.mark_as_success, request.session_id)
 
-        return SignInResponse(
+        return SignInResponse.model_construct(
             access_token=access_token,
             refresh_token=refresh_token,
         )
     except Exception as e:
-        logger.error("Sign in failed", error=str(e))
+        logger.error("Sign in failed", error=e)
         raise HTTPException(status_code=422, detail=str(e))
 
 
 @router.post("/refresh-token", response_model=RefreshTokenResponse)
 async def refresh_token(request: RefreshTokenRequest):
-    try:
-        access_token, refresh_token = RefreshTokenOperation.execute(request)
-        return RefreshTokenResponse(
-            access_token=access_token,
-            refresh_token=refresh_token,
-        )
-    except Exception as e:
-        logger.error("Refresh token failed", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+    access_token, refresh_token = await run_in_threadpool(RefreshTokenOperation.execute, request)
+    return RefreshTokenResponse.model_construct(
+        access_token=access_token,
+        refresh_token=refresh_token,
+    )
 
 
 @router.post("/send-otp", response_model=SendOTPResponse)
 async def send_otp(
     request: SendOTPRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ):
+    # Imported on first use: the task module pulls in Celery and the mail stack.
+    from app.tasks.auth.send_otp_task import send_otp_task
+
     try:
-        send_otp_task.apply_async(kwargs={
+        # Published to the broker by the dispatcher, off the request path.
+        await task_dispatcher.dispatch(send_otp_task, {
             "email": current_user.email, 
             "otp_action": request.action.value,
             "data": request.data,
         })
-        return {
-            "message": "OTP sent successfully",
-            "email": current_user.email,
-            "expires_in_minutes": 10,
-        }
+        return SendOTPResponse.model_construct(
+            message="OTP sent successfully",
+            email=current_user.email,
+            expires_in_minutes=10,
+        )
 
     except ValueError as e:
-        logger.error("Send OTP validation failed", error=str(e))
+        logger.warning("Send OTP validation failed")
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error("Send OTP failed", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+    except PermissionError:
+        logger.warning("Send OTP not permitted")
+        raise HTTPException(status_code=403, detail="OTP not permitted")
+    except Exception:
+        logger.exception("Send OTP failed")
+        raise HTTPException(status_code=500, detail="OTP failed")
 
 
 @router.post("/verify-otp")
 async def verify_otp(
     request: VerifyOTPRequest,
-    current_user: User = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: CurrentUser,
 ):
     try:
+        # The session may only be marked once the OTP has been accepted.
         await VerifyOTPOperation.execute(current_user, request.otp, request.action)
         await AuthSessionOperation.mark_as_success(current_user, request.session_id)
-        
+
         if request.session_id:
-            SystemTaskOperation.mark_as_success(request.session_id)
+            background_tasks.add_task(SystemTaskOperation.mark_as_success, request.session_id)
 
         return {
             "message": "OTP verified successfully",
         }
     except ValueError as e:
-        logger.error("Verify OTP validation failed", error=str(e))
+        logger.warning("Verify OTP validation failed")
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error("Verify OTP failed", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+    except PermissionError:
+        logger.warning("Verify OTP not permitted")
+        raise HTTPException(status_code=403, detail="OTP not permitted")
+    except Exception:
+        logger.exception("Verify OTP failed")
+        raise HTTPException(status_code=500, detail="OTP failed")
 
 
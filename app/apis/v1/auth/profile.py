@@ -1,10 +1,11 @@
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.libs.database import get_db
-from app.apis.deps import get_current_user
+from app.libs.database import get_async_db
+from app.libs.response_cache import ResponseCache
+from app.apis.deps import CurrentUser
 from app.core.logging import logger
-from app.models.user import User
 from app.schemas.auth import LMSProfileResponse
 from app.schemas.user import UserSerializer
 from app.schemas.tenant import TenantSerializer
@@ -13,19 +14,29 @@ from app.operations.user.get_lms_profile import GetLMSProfileOperation
 
 router = APIRouter()
 
+# Evicted by the user, tenant and tenant member write endpoints.
+profile_cache = ResponseCache("profile", ttl_seconds=120)
+
 
 @router.get("/lms-profile", response_model=LMSProfileResponse)
-def get_lms_profile(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def get_lms_profile(
+    http_request: Request,
+    current_user: CurrentUser,
+    db: AsyncSession = Depends(get_async_db)
 ):
     try:
+        cached = await run_in_threadpool(profile_cache.get, http_request, current_user.id)
+        if cached is not None:
+            return cached
+
         operation = GetLMSProfileOperation(db, current_user)
-        user, tenant = operation.execute()
-        return {
+        user, tenant = await operation.execute()
+        response = {
             "user": user.to_dict(),
             "tenant": tenant.to_dict(),
         }
+        await run_in_threadpool(profile_cache.set, http_request, current_user.id, response)
+        return response
     except Exception as e:
-        logger.error("Get LMS profile failed", error=str(e))
+        logger.error("Get LMS profile failed", error=e)
         raise HTTPException(status_code=422)
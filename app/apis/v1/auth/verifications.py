@@ -1,8 +1,6 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter
 
-from app.apis.deps import get_current_user
-from app.core.logging import logger
-from app.models.user import User
+from app.apis.deps import CurrentUser
 from app.schemas.auth import (
     VerifyStoreConfigurationAccessRequest,
     VerifyStoreConfigurationAccessResponse
@@ -21,15 +19,11 @@ router = APIRouter()
 )
 async def verify_store_configuration_access(
     request: VerifyStoreConfigurationAccessRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ):
-    try:
-        system_task = await VerifyForStoreConfigurationAccessOperation.execute(current_user, request.tenant_id)
-        return {
-            "system_task_id": system_task.id,
-        }
-    except Exception as e:
-        logger.error("Verify store configuration access failed", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+    system_task = await VerifyForStoreConfigurationAccessOperation.execute(current_user, request.tenant_id)
+    return {
+        "system_task_id": system_task.id,
+    }
 
 
@@ -1,12 +1,18 @@
-from datetime import datetime
-from fastapi import APIRouter, Depends
+import asyncio
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from typing import List
 
 from app.apis.deps import require_permissions
+from app.libs.response_cache import ResponseCache
 from app.models.user import User
 from app.operations.dashboard.list_overview_order_operation import ListOverviewOrderOperation
 from app.operations.dashboard.get_overview_order_by_day_bar_chart_operation import GetOverviewOrderByDayBarChartOperation
 from app.schemas.dashboard.overview import (
+    OverviewDashboardQueryParams,
+    OverviewDashboardResponse,
     OverviewKeyMetricsQueryParams,
     OverviewKeyMetricsResponse,
     OverviewOrderByDayQueryParams,
@@ -23,138 +29,219 @@ from app.operations.dashboard.get_overview_revenue_by_day_bar_chart_operation im
 from app.operations.dashboard.list_overview_order_operation import ListOverviewOrderOperation
 from app.operations.dashboard.get_overview_machine_status_line_chart_operation import GetOverviewMachineStatusLineChartOperation
 from app.utils.pagination import get_total_pages
-from app.utils.timezone import get_tzinfo, to_utc
+from app.utils.timezone import month_to_date_utc
 from app.schemas.pagination import PaginatedResponse
 
 router = APIRouter()
 
+# Aggregates over historical orders and machine states. Keys are per user
+# (and per query string), so a response is never served across tenants;
+# staleness is bounded by the TTL because orders are also written by payment
+# callbacks and background tasks that bypass these routes.
+overview_cache = ResponseCache("overview", ttl_seconds=300)
+CHART_CACHE_TTL_SECONDS = 600
+
+# One dependency shared by every dashboard.overview.view route. These routes
+# need the user for their cache keys, so it stays a route parameter instead of
+# a router-level dependency; the order list and machine chart check other
+# permissions.
+require_overview_view = require_permissions(["dashboard.overview.view"])
+
+
+@router.get("", response_model=OverviewDashboardResponse)
+async def get_overview_dashboard(
+    http_request: Request,
+    query_params: OverviewDashboardQueryParams = Depends(),
+    current_user: User = Depends(require_overview_view),
+):
+    """
+    Key metrics and both bar charts in one response. The three operations
+    each use their own session, so they run side by side in the threadpool
+    and the page waits for the slowest one instead of the sum.
+    """
+    cached = await run_in_threadpool(overview_cache.get, http_request, current_user.id)
+    if cached is not None:
+        return cached
+
+    if not query_params.start_date and not query_params.end_date:
+        # Same default range as the bar-chart endpoints
+        start_date, end_date = month_to_date_utc()
+    else:
+        start_date = query_params.start_date
+        end_date = query_params.end_date
+
+    key_metrics_operation = GetDashboardOverviewKeyMetricsOperation(
+        tenant_id=query_params.tenant_id,
+        store_id=query_params.store_id,
+        query_params=query_params,
+    )
+    order_by_day_operation = GetOverviewOrderByDayBarChartOperation(tenant_id=query_params.tenant_id)
+    revenue_by_day_operation = GetOverviewRevenueByDayBarChartOperation(tenant_id=query_params.tenant_id)
+
+    key_metrics, order_by_day, revenue_by_day = await asyncio.gather(
+        run_in_threadpool(key_metrics_operation.execute),
+        run_in_threadpool(
+            order_by_day_operation.execute,
+            start_date=start_date,
+            end_date=end_date,
+        ),
+        run_in_threadpool(
+            revenue_by_day_operation.execute,
+            start_date=start_date,
+            end_date=end_date,
+        ),
+    )
+
+    result = {
+        "key_metrics": key_metrics,
+        "order_by_day": order_by_day,
+        "revenue_by_day": revenue_by_day,
+    }
+    await run_in_threadpool(overview_cache.set, http_request, current_user.id, result)
+    return result
+
 
 @router.get("/key-metrics", response_model=OverviewKeyMetricsResponse)
 async def get_overview_key_metrics(
+    http_request: Request,
     query_params: OverviewKeyMetricsQueryParams = Depends(),
-    _: User = Depends(require_permissions(["dashboard.overview.view"])),
+    current_user: User = Depends(require_overview_view),
 ):  
+    cached = await run_in_threadpool(overview_cache.get, http_request, current_user.id)
+    if cached is not None:
+        return cached
+
     operation = GetDashboardOverviewKeyMetricsOperation(
         tenant_id=query_params.tenant_id,
         store_id=query_params.store_id,
         query_params=query_params,
     )
-    result = operation.execute()
+    result = await run_in_threadpool(operation.execute)
+    await run_in_threadpool(overview_cache.set, http_request, current_user.id, result)
     return result
 
 
 @router.get("/order-by-day-bar-chart", response_model=OverviewOrderByDayBarChartResponse)
 async def get_overview_order_by_day_bar_chart(
+    http_request: Request,
     query_params: OverviewOrderByDayQueryParams = Depends(),
-    _: User = Depends(require_permissions(["dashboard.overview.view"])),
+    current_user: User = Depends(require_overview_view),
 ):  
-    tzinfo = get_tzinfo()
-    now = datetime.now(tzinfo)
+    cached = await run_in_threadpool(overview_cache.get, http_request, current_user.id)
+    if cached is not None:
+        return cached
 
     if not query_params.start_date and not query_params.end_date:
-        # Create default dates in Vietnam timezone, then convert to UTC
-        start_date = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        end_date = now
-        start_date = to_utc(start_date)
-        end_date = to_utc(end_date)
+        # Default to the current month in Vietnam timezone, as UTC
+        start_date, end_date = month_to_date_utc()
     else:
         # Dates are already converted to UTC by the validator
         start_date = query_params.start_date
         end_date = query_params.end_date
 
     operation = GetOverviewOrderByDayBarChartOperation(tenant_id=query_params.tenant_id)
-    result = operation.execute(
+    result = await run_in_threadpool(
+        operation.execute,
         start_date=start_date,
         end_date=end_date,
     )
+    await run_in_threadpool(
+        overview_cache.set,
+        http_request,
+        current_user.id,
+        result,
+        CHART_CACHE_TTL_SECONDS,
+    )
 
     return result
 
 
 @router.get("/revenue-by-day-bar-chart", response_model=OverviewRevenueByDayBarChartResponse)
 async def get_overview_revenue_by_day_bar_chart(
+    http_request: Request,
     query_params: OverviewRevenueByDayQueryParams = Depends(),
-    _: User = Depends(require_permissions(["dashboard.overview.view"])),
+    current_user: User = Depends(require_overview_view),
 ):  
-    tzinfo = get_tzinfo()
-    now = datetime.now(tzinfo)
+    cached = await run_in_threadpool(overview_cache.get, http_request, current_user.id)
+    if cached is not None:
+        return cached
 
     if not query_params.start_date and not query_params.end_date:
-        # Create default dates in Vietnam timezone, then convert to UTC
-        start_date = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        end_date = now
-        start_date = to_utc(start_date)
-        end_date = to_utc(end_date)
+        # Default to the current month in Vietnam timezone, as UTC
+        start_date, end_date = month_to_date_utc()
     else:
         # Dates are already converted to UTC by the validator
         start_date = query_params.start_date
         end_date = query_params.end_date
 
     operation = GetOverviewRevenueByDayBarChartOperation(tenant_id=query_params.tenant_id)
-    result = operation.execute(
+    result = await run_in_threadpool(
+        operation.execute,
         start_date=start_date,
         end_date=end_date,
     )
+    await run_in_threadpool(
+        overview_cache.set,
+        http_request,
+        current_user.id,
+        result,
+        CHART_CACHE_TTL_SECONDS,
+    )
 
     return result
 
 
-@router.get("/order", response_model=PaginatedResponse[ListOverviewOrdersResponseItem])
+# Rows come back from the operation already in response shape, so they are
+# returned as plain dicts through ORJSONResponse without per-item validation.
+@router.get(
+    "/order",
+    response_model=None,
+    responses={200: {"model": PaginatedResponse[ListOverviewOrdersResponseItem]}},
+)
 async def list_overview_orders(
     query_params: ListOverviewOrdersQueryParams = Depends(),
     current_user: User = Depends(require_permissions([
         "order.list",
     ])),
 ):
-    total, data = ListOverviewOrderOperation.execute(
+    total, data = await run_in_threadpool(
+        ListOverviewOrderOperation.execute,
         current_user=current_user,
         query_params=query_params
     )
-    
-    items = []
-    for row in data:
-        row_dict = dict(row._mapping)
-        order = row_dict['Order']
-        
-        item_dict = {
-            "id": order.id,
-            "created_at": order.created_at,
-            "updated_at": order.updated_at,
-            "deleted_at": order.deleted_at,
-            "created_by": order.created_by,
-            "updated_by": order.updated_by,
-            "deleted_by": order.deleted_by if order.deleted_by else None,
-            "total_amount": order.total_amount,
-            "total_washer": order.total_washer,
-            "total_dryer": order.total_dryer,
-            "status": order.status,
-            "payment_status": row_dict['payment_status'],
-            "transaction_code": row_dict['transaction_code'],
-            "payment_method": row_dict['payment_method'],
-        }
-        items.append(ListOverviewOrdersResponseItem.model_validate(item_dict))
-    
-    return {
+
+    return ORJSONResponse({
         "page": query_params.page,
         "page_size": query_params.page_size,
         "total": total,
         "total_pages": get_total_pages(total, query_params.page_size),
-        "data": items,
-    }
+        # Rows also carry the window count used for `total`.
+        "data": [
+            {key: value for key, value in row._mapping.items() if key != "total"}
+            for row in data
+        ],
+    })
 
 
 @router.get("/machine-status-line-chart", response_model=List[MachineStatusLineChartData])
 async def get_machine_status_line_chart(
+    http_request: Request,
     query_params: GetOverviewMachineStatusLineChartQueryParams = Depends(),
-    _: User = Depends(require_permissions([
+    current_user: User = Depends(require_permissions([
         "machine.list",
     ])),
 ):  
-    result = GetOverviewMachineStatusLineChartOperation.execute(
+    cached = await run_in_threadpool(overview_cache.get, http_request, current_user.id)
+    if cached is not None:
+        return cached
+
+    result = await run_in_threadpool(
+        GetOverviewMachineStatusLineChartOperation.execute,
         store_id=query_params.store_id,
         machine_id=query_params.machine_id,
         start_date=query_params.start_date,
         end_date=query_params.end_date,
     )
+    await run_in_threadpool(overview_cache.set, http_request, current_user.id, result)
     return result
 
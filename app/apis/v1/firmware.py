@@ -1,13 +1,14 @@
 from uuid import UUID
 
 from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, status
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.apis.deps import get_current_user
+from app.apis.deps import CurrentUser
 from app.core.logging import logger
-from app.libs.database import get_db
+from app.libs.database import get_async_db, get_async_read_only_db
 from app.models.firmware import Firmware, FirmwareStatus
-from app.models.user import User
 from app.operations.file.upload_file_operation import UploadFileOperation
 from app.operations.firmware.create_firmware_operation import CreateFirmwareOperation
 from app.operations.firmware.list_firmware_operation import ListFirmwareOperation
@@ -32,223 +33,211 @@ from app.utils.pagination import get_total_pages
 router = APIRouter()
 
 
+async def _update_live_firmware(
+    db: AsyncSession,
+    firmware_id: UUID,
+    values: dict,
+    *conditions,
+) -> bool:
+    """
+    Apply a state change to a non-deleted firmware in a single
+    UPDATE ... RETURNING, so the check and the write are one atomic
+    round-trip. Returns False when no row matched.
+    """
+    updated_id = await db.scalar(
+        update(Firmware)
+        .where(Firmware.id == firmware_id, Firmware.deleted_at.is_(None), *conditions)
+        .values(**values)
+        .returning(Firmware.id)
+    )
+    await db.commit()
+    return updated_id is not None
+
+
+async def _live_firmware_exists(db: AsyncSession, firmware_id: UUID) -> bool:
+    return await db.scalar(
+        select(Firmware.id)
+        .where(Firmware.id == firmware_id, Firmware.deleted_at.is_(None))
+    ) is not None
+
+
 @router.post("/upload")
 async def upload_firmware(
     file: UploadFile = File(...),
 ):
     try:
         upload_operation = UploadFileOperation(file.filename)
-        upload_operation.execute(file.file)
+        await run_in_threadpool(upload_operation.execute, file.file)
 
         return upload_operation.result
-    except Exception as e:
-        logger.error(f"Error uploading firmware: {str(e)}")
+    except ValueError as e:
+        # UploadFileOperation reports storage failures as ValueError, which
+        # the app-level handler would otherwise turn into a 404.
+        logger.error("Error uploading firmware", error=e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("", response_model=PaginatedResponse[FirmwareSerializer])
 async def list_firmware(
+    current_user: CurrentUser,
     query_params: ListFirmwareQueryParams = Depends(),
-    current_user: User = Depends(get_current_user),
 ):
-    try:
-        total, firmware = ListFirmwareOperation().execute(current_user, query_params)
-        return {
-            "page": query_params.page,
-            "page_size": query_params.page_size,
-            "total": total,
-            "total_pages": get_total_pages(total, query_params.page_size),
-            "data": firmware,
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    total, firmware = await run_in_threadpool(
+        ListFirmwareOperation().execute, current_user, query_params
+    )
+    return {
+        "page": query_params.page,
+        "page_size": query_params.page_size,
+        "total": total,
+        "total_pages": get_total_pages(total, query_params.page_size),
+        "data": firmware,
+    }
 
 
 @router.post("", response_model=FirmwareSerializer)
 async def create_firmware(
     payload: FirmwareCreateSchema,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ):
-    try:
-        create_firmware_operation = CreateFirmwareOperation()
-        firmware = create_firmware_operation.execute(current_user, payload)
-        return firmware
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    create_firmware_operation = CreateFirmwareOperation()
+    firmware = await run_in_threadpool(
+        create_firmware_operation.execute, current_user, payload
+    )
+    return firmware
 
 
 @router.get("/{firmware_id}", response_model=FirmwareSerializer)
 async def get_firmware(
     firmware_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: CurrentUser,
+    db: AsyncSession = Depends(get_async_read_only_db),
 ):
-    try:
-        if not current_user.is_admin:
-            raise PermissionError("You are not allowed to get firmware")
-        
-        firmware = (
-            db.query(Firmware)
-            .filter(Firmware.id == firmware_id)
-            .filter(Firmware.deleted_at.is_(None))
-            .first()
-        )
-        if not firmware:
-            raise ValueError("Firmware not found")
+    if not current_user.is_admin:
+        raise PermissionError("You are not allowed to get firmware")
+    
+    firmware = await db.scalar(
+        select(Firmware)
+        .where(Firmware.id == firmware_id)
+        .where(Firmware.deleted_at.is_(None))
+    )
+    if not firmware:
+        raise ValueError("Firmware not found")
 
-        return firmware
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except PermissionError as e:
-        raise HTTPException(status_code=403, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return firmware
 
 
 @router.patch("/{firmware_id}", response_model=FirmwareSerializer)
 async def update_firmware(
     firmware_id: UUID,
     payload: FirmwareUpdateSchema,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ):
-    try:
-        update_firmware_operation = UpdateFirmwareOperation()
-        firmware = update_firmware_operation.execute(current_user, firmware_id, payload)
+    update_firmware_operation = UpdateFirmwareOperation()
+    firmware = await run_in_threadpool(
+        update_firmware_operation.execute, current_user, firmware_id, payload
+    )
 
-        return firmware
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except PermissionError as e:
-        raise HTTPException(status_code=403, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return firmware
 
 
 @router.delete("/{firmware_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_firmware(
     firmware_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: CurrentUser,
+    db: AsyncSession = Depends(get_async_db),
 ):
-    try:
-        if not current_user.is_admin:
-            raise PermissionError("You are not allowed to delete firmware")
-        
-        firmware = db.query(Firmware).filter(Firmware.id == firmware_id).first()
-        if not firmware:
-            raise ValueError("Firmware not found")
-        
-        firmware.soft_delete(current_user.id)
-        db.add(firmware)
-        db.commit()
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except PermissionError as e:
-        raise HTTPException(status_code=403, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    if not current_user.is_admin:
+        raise PermissionError("You are not allowed to delete firmware")
+    
+    deleted = await _update_live_firmware(
+        db,
+        firmware_id,
+        {"deleted_at": func.now(), "deleted_by": current_user.id},
+    )
+    if not deleted:
+        raise ValueError("Firmware not found")
 
 
 @router.get("/{firmware_id}/provisioned-controllers", response_model=PaginatedResponse[ProvisionedControllerSerializer])
 async def list_provisioned_controllers(
     firmware_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
     query_params: ListProvisionedControllersQueryParams = Depends(),
 ):
-    try:
-        list_provisioned_controllers_operation = ListProvisionedControllersOperation()
-        total, controllers = list_provisioned_controllers_operation.execute(current_user, firmware_id, query_params)
-        return {
-            "page": query_params.page,
-            "page_size": query_params.page_size,
-            "total": total,
-            "total_pages": get_total_pages(total, query_params.page_size),
-            "data": controllers,
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    list_provisioned_controllers_operation = ListProvisionedControllersOperation()
+    total, controllers = await run_in_threadpool(
+        list_provisioned_controllers_operation.execute, current_user, firmware_id, query_params
+    )
+    return {
+        "page": query_params.page,
+        "page_size": query_params.page_size,
+        "total": total,
+        "total_pages": get_total_pages(total, query_params.page_size),
+        "data": controllers,
+    }
 
 
 @router.post("/{firmware_id}/flash", status_code=status.HTTP_204_NO_CONTENT)
 async def flash_firmware(
     firmware_id: UUID,
     payload: ProvisionFirmwareSchema,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ):
-    try:
-        flash_firmware_operation = FlashFirmwareOperation()
-        flash_firmware_operation.execute(current_user, firmware_id, payload)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    flash_firmware_operation = FlashFirmwareOperation()
+    await run_in_threadpool(
+        flash_firmware_operation.execute, current_user, firmware_id, payload
+    )
 
 
 @router.post("/{firmware_id}/release", status_code=status.HTTP_204_NO_CONTENT)
 async def release_firmware(
     firmware_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: CurrentUser,
+    db: AsyncSession = Depends(get_async_db),
 ):
-    try:
-        firmware = (
-            db.query(Firmware)
-            .filter(Firmware.id == firmware_id)
-            .filter(Firmware.deleted_at.is_(None))
-            .first()
-        )
-        if not firmware:
+    released = await _update_live_firmware(
+        db,
+        firmware_id,
+        {"status": FirmwareStatus.RELEASED, "updated_by": current_user.id},
+        Firmware.status != FirmwareStatus.RELEASED,
+    )
+    if not released:
+        # Only on failure: tell a missing firmware from a wrong status.
+        if not await _live_firmware_exists(db, firmware_id):
             raise ValueError("Firmware not found")
-        
-        if firmware.status == FirmwareStatus.RELEASED:
-            raise ValueError("Firmware is not in draft status")
-        
-        firmware.release(current_user.id)
-        db.add(firmware)
-        db.commit()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Firmware is not in draft status")
 
 
 @router.post("/{firmware_id}/deprecate", status_code=status.HTTP_204_NO_CONTENT)
 async def deprecate_firmware(
     firmware_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: CurrentUser,
+    db: AsyncSession = Depends(get_async_db),
 ):
-    try:
-        firmware = (
-            db.query(Firmware)
-            .filter(Firmware.id == firmware_id)
-            .filter(Firmware.deleted_at.is_(None))
-            .first()
-        )
-        if not firmware:
+    deprecated = await _update_live_firmware(
+        db,
+        firmware_id,
+        {"status": FirmwareStatus.DEPRECATED, "updated_by": current_user.id},
+        Firmware.status != FirmwareStatus.DRAFT,
+    )
+    if not deprecated:
+        if not await _live_firmware_exists(db, firmware_id):
             raise ValueError("Firmware not found")
-        
-        if firmware.status == FirmwareStatus.DRAFT:
-            raise ValueError("Cannot deprecate draft firmware")
-        
-        firmware.deprecate(current_user.id)
-        db.add(firmware)
-        db.commit()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Cannot deprecate draft firmware")
 
 
 @router.get("/{firmware_id}/provisioning-controllers", response_model=PaginatedResponse[ProvisioningControllerSerializer])
 async def list_provisioning_controllers(
     firmware_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
     query_params: ListProvisioningControllersQueryParams = Depends(),
 ):
-    try:
-        list_provisioning_controllers_operation = ListProvisioningControllersOperation(current_user, firmware_id, query_params)
-        total, controllers = list_provisioning_controllers_operation.execute()
-        return {
-            "page": query_params.page,
-            "page_size": query_params.page_size,
-            "total": total,
-            "total_pages": get_total_pages(total, query_params.page_size),
-            "data": controllers,
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    list_provisioning_controllers_operation = ListProvisioningControllersOperation(current_user, firmware_id, query_params)
+    total, controllers = await run_in_threadpool(list_provisioning_controllers_operation.execute)
+    return {
+        "page": query_params.page,
+        "page_size": query_params.page_size,
+        "total": total,
+        "total_pages": get_total_pages(total, query_params.page_size),
+        "data": controllers,
+    }
@@ -1,9 +1,9 @@
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, status
+from fastapi.concurrency import run_in_threadpool
 
-from app.apis.deps import get_current_user
-from app.models.user import User
+from app.apis.deps import CurrentUser
 from app.operations.firmware.cancel_update_firmware_operation import CancelUpdateFirmwareOperation
 
 
@@ -13,16 +13,9 @@ router = APIRouter()
 @router.post("/{firmware_deployment_id}/cancel", status_code=status.HTTP_204_NO_CONTENT)
 async def cancel_update_firmware(
     firmware_deployment_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ):
-    try:
-        cancel_update_firmware_operation = CancelUpdateFirmwareOperation(current_user, firmware_deployment_id)
-        cancel_update_firmware_operation.execute()
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except PermissionError as e:
-        raise HTTPException(status_code=403, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    cancel_update_firmware_operation = CancelUpdateFirmwareOperation(current_user, firmware_deployment_id)
+    await run_in_threadpool(cancel_update_firmware_operation.execute)
 
 
@@ -1,8 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, Path, status
-from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 
-from app.apis.deps import get_current_user
-from app.models.user import User
+from app.apis.deps import CurrentUser, UUIDPathParam
+from app.libs.response_cache import ResponseCache
 from app.operations.machine import MachineOperation
 from app.schemas.machine import (
     MachineSerializer,
@@ -11,162 +11,161 @@ from app.schemas.machine import (
     ListMachineQueryParams,
     StartMachineRequest,
 )
-from app.schemas.pagination import PaginatedResponse
+from app.schemas.pagination import CursorPaginatedResponse, PaginatedResponse
 from app.utils.coin import calculate_pulse_value
-from app.utils.pagination import get_total_pages
+from app.utils.pagination import build_paginated_response
+from app.utils.responses import ORJSONResponse, PydanticResponse, etag_response, serialize_rows
 
 router = APIRouter()
 
+# Machine status also changes from controller events, so entries are kept
+# only briefly; the write endpoints below evict the group.
+machine_cache = ResponseCache("machine", ttl_seconds=5)
 
-@router.get("", response_model=PaginatedResponse[MachineSerializer])
+# Dashboards poll the list, so its rendered body is reused for a second.
+LIST_CACHE_TTL_SECONDS = 1
+LIST_CACHE_HEADERS = {"Cache-Control": f"private, max-age={LIST_CACHE_TTL_SECONDS}"}
+
+
+@router.get(
+    "",
+    response_model=None,
+    responses={200: {"model": PaginatedResponse[MachineSerializer] | CursorPaginatedResponse[MachineSerializer]}},
+)
 async def list_machines(
+    http_request: Request,
+    current_user: CurrentUser,
     query_params: ListMachineQueryParams = Depends(),
-    current_user: User = Depends(get_current_user),
 ):
     """List machines with pagination and filtering"""
-    try:
-        total, machines = MachineOperation.list(current_user, query_params)
-
-        return {
-            "page": query_params.page,
-            "page_size": query_params.page_size,
-            "total": total,
-            "total_pages": get_total_pages(total, query_params.page_size),
-            "data": machines,
-        }
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
+    body = await run_in_threadpool(machine_cache.get_body, http_request, current_user.id)
+    if body is None:
+        total, machines = await run_in_threadpool(MachineOperation.list, current_user, query_params)
+        body = ORJSONResponse(build_paginated_response(
+            query_params,
+            total,
+            serialize_rows(machines, MachineSerializer),
+        )).body
+        await run_in_threadpool(
+            machine_cache.set_body, http_request, current_user.id, body, LIST_CACHE_TTL_SECONDS,
         )
 
+    return Response(body, media_type="application/json", headers=LIST_CACHE_HEADERS)
 
-@router.post("", response_model=MachineSerializer, status_code=status.HTTP_201_CREATED)
+
+# Single-machine endpoints render the serializer themselves (get_machine as a
+# cached, ETag-tagged dict) instead of having FastAPI validate and encode it
+# again; `responses` keeps the schema in the OpenAPI docs.
+@router.post(
+    "",
+    response_model=None,
+    responses={201: {"model": MachineSerializer}},
+    status_code=status.HTTP_201_CREATED,
+)
 async def create_machine(
     request: AddMachineRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ):
     """Create a new machine"""
     try:
-        machine = MachineOperation.create(current_user, request)
-        return MachineSerializer.model_validate(machine)
+        machine = await run_in_threadpool(MachineOperation.create, current_user, request)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+
+    await run_in_threadpool(machine_cache.evict)
+    # Freshly loaded from the database, so there is nothing to validate.
+    return PydanticResponse(
+        MachineSerializer.model_construct(**machine.__dict__),
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
-@router.get("/{machine_id}", response_model=MachineSerializer)
+@router.get(
+    "/{machine_id}",
+    response_model=None,
+    responses={200: {"model": MachineSerializer}},
+)
 async def get_machine(
-    machine_id: UUID,
-    current_user: User = Depends(get_current_user),
+    http_request: Request,
+    machine_id: UUIDPathParam,
+    current_user: CurrentUser,
 ):
     """Get a specific machine by ID"""
-    try:
-        machine = MachineOperation.get(current_user, machine_id)
-        return machine
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    response = await run_in_threadpool(machine_cache.get, http_request, current_user.id)
+    if response is None:
+        machine = await run_in_threadpool(MachineOperation.get, current_user, machine_id)
+        response = MachineSerializer.model_construct(**machine._mapping).model_dump(mode="json")
+        await run_in_threadpool(machine_cache.set, http_request, current_user.id, response)
 
+    return etag_response(http_request, response)
 
-@router.patch("/{machine_id}", response_model=MachineSerializer)
+
+@router.patch(
+    "/{machine_id}",
+    response_model=None,
+    responses={200: {"model": MachineSerializer}},
+)
 async def update_machine(
-    machine_id: UUID,
+    machine_id: UUIDPathParam,
     request: UpdateMachineRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ):
     """Update a machine partially"""
-    try:
-        machine = MachineOperation.update_partially(current_user, machine_id, request)
-        return machine
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    machine = await run_in_threadpool(MachineOperation.update_partially, current_user, machine_id, request)
+    await run_in_threadpool(machine_cache.evict)
+    return PydanticResponse(MachineSerializer.model_construct(**machine.__dict__))
 
 
 @router.delete("/{machine_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_machine(
-    machine_id: UUID,
-    current_user: User = Depends(get_current_user),
+    machine_id: UUIDPathParam,
+    current_user: CurrentUser,
 ):
     """Soft delete a machine"""
-    try:
-        MachineOperation.delete(current_user, machine_id)
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    await run_in_threadpool(MachineOperation.delete, current_user, machine_id)
+    await run_in_threadpool(machine_cache.evict)
 
 
 @router.post("/{machine_id}/start")
 async def start_machine_operation(
-    machine_id: UUID,
+    machine_id: UUIDPathParam,
     request: StartMachineRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ):
     """Start machine operation (set status to BUSY)"""
     try:
-        MachineOperation.start(
+        await run_in_threadpool(
+            MachineOperation.start,
             user=current_user,
             machine_id=machine_id,
             total_amount=request.total_amount,
         )
-        return {"message": "Machine operation started"}
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+
+    await run_in_threadpool(machine_cache.evict)
+    return {"message": "Machine operation started"}
 
 
 @router.post("/{machine_id}/activate")
 async def activate_machine(
-    machine_id: UUID,
-    current_user: User = Depends(get_current_user),
+    machine_id: UUIDPathParam,
+    current_user: CurrentUser,
 ):
     """Activate machine (set status to IDLE)"""
     try:
-        MachineOperation.activate_machine(current_user, machine_id)
-        return {"message": "Machine activated"}
+        await run_in_threadpool(MachineOperation.activate_machine, current_user, machine_id)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+
+    await run_in_threadpool(machine_cache.evict)
+    return {"message": "Machine activated"}
@@ -1,60 +1,84 @@
 import uuid
+from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import case, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.apis.deps import get_current_user
-from app.core.logging import logger
-from app.libs.database import get_db
+from app.apis.deps import CurrentUser
+from app.libs.database import get_async_db, get_db
+from app.libs.response_cache import ResponseCache
+from app.libs.task_dispatcher import task_dispatcher
 from app.models.payment import PaymentStatus, PaymentProvider
 from app.models.payment import Payment
 from app.models.order import Order
-from app.models.user import User, UserRole
+from app.models.user import UserRole
 from app.operations.order import OrderOperation
 from app.operations.order.list_orders import ListOrdersOperation
 from app.operations.order.order_detail_operation import OrderDetailOperation
-from app.operations.order.sync_up_order_operation import SyncUpOrderOperation
 from app.operations.promotion.check_and_apply_promotion_operation import CheckAndApplyPromotionOperation
 from app.schemas.order import (
     CreateOrderRequest,
     OrderResponse,
+    OrderWithDetailsResponse,
     ListOrderQueryParams,
     OrderDetailResponse,
     ListOrderDetailQueryParams,
 )
-from app.schemas.pagination import PaginatedResponse
+from app.schemas.pagination import CursorPaginatedResponse, PaginatedResponse
 from app.operations.payment.payment_operation import PaymentOperation
-from app.utils.pagination import get_total_pages
+from app.tasks.order.sync_up_order_task import sync_up_order_task
+from app.utils.pagination import build_paginated_response
+from app.utils.responses import ORJSONResponse, etag_response, serialize_rows
 
 router = APIRouter()
 
+# Payments update orders outside this router, so entries are kept only
+# briefly; the order write endpoints below evict the group.
+order_cache = ResponseCache("order", ttl_seconds=5)
 
-@router.get("/details", response_model=PaginatedResponse[OrderDetailResponse])
+# Dashboards poll the lists, so their rendered body is reused for a second.
+LIST_CACHE_TTL_SECONDS = 1
+LIST_CACHE_HEADERS = {"Cache-Control": f"private, max-age={LIST_CACHE_TTL_SECONDS}"}
+
+
+# The list endpoints return query rows projected onto the response schema
+# through ORJSONResponse, skipping FastAPI's per-row validation and encoding;
+# `responses` keeps the schema in the OpenAPI docs.
+@router.get(
+    "/details",
+    response_model=None,
+    responses={200: {"model": PaginatedResponse[OrderDetailResponse] | CursorPaginatedResponse[OrderDetailResponse]}},
+)
 async def list_order_details(
+    http_request: Request,
+    current_user: CurrentUser,
     query_params: ListOrderDetailQueryParams = Depends(),
-    _: User = Depends(get_current_user)
 ):
     """
     Get order details.
     """
-    try:
-        total, order_details = OrderDetailOperation.list(query_params)
-        return {
-            "page": query_params.page,
-            "page_size": query_params.page_size,
-            "total": total,
-            "total_pages": get_total_pages(total, query_params.page_size),
-            "data": order_details,
-        }
-    except Exception as e:
-        logger.error(f"Error getting order details: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    body = await run_in_threadpool(order_cache.get_body, http_request, current_user.id)
+    if body is None:
+        total, order_details = await run_in_threadpool(OrderDetailOperation.list, query_params)
+        body = ORJSONResponse(build_paginated_response(
+            query_params,
+            total,
+            serialize_rows(order_details, OrderDetailResponse),
+        )).body
+        await run_in_threadpool(
+            order_cache.set_body, http_request, current_user.id, body, LIST_CACHE_TTL_SECONDS,
+        )
+
+    return Response(body, media_type="application/json", headers=LIST_CACHE_HEADERS)
 
 
 @router.post("", response_model=OrderResponse, status_code=201)
 async def create_order(
     request: CreateOrderRequest,
-    user: User = Depends(get_current_user)
+    user: CurrentUser
 ):
     """
     Create a new order.
@@ -63,186 +87,149 @@ async def create_order(
     The order will be created with status NEW and then moved to WAITING_FOR_PAYMENT.
     """
     try:
-        order = OrderOperation.create_order(request, user.id)
-        return order
+        order = await run_in_threadpool(OrderOperation.create_order, request, user.id)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Error creating order: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+
+    return order
 
 
-@router.get("", response_model=PaginatedResponse[OrderResponse])
+@router.get(
+    "",
+    response_model=None,
+    responses={200: {"model": PaginatedResponse[OrderWithDetailsResponse] | CursorPaginatedResponse[OrderWithDetailsResponse]}},
+)
 async def list_orders(
+    http_request: Request,
+    current_user: CurrentUser,
     query_params: ListOrderQueryParams = Depends(),
     store_ids: list[uuid.UUID] = Query(None, description="List of store IDs to filter orders"),
-    current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    try:
+    body = await run_in_threadpool(order_cache.get_body, http_request, current_user.id)
+    if body is None:
         query_params.store_ids = store_ids
-        
+
         operation = ListOrdersOperation(db, current_user, query_params)
-        total, orders = operation.execute()
-
-        return {
-            "page": query_params.page,
-            "page_size": query_params.page_size,
-            "total": total,
-            "total_pages": get_total_pages(total, query_params.page_size),
-            "data": orders,
-        }
-    except Exception as e:
-        logger.error("List orders failed", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@router.post("/{order_id}/trigger-payment-success")
-async def test_trigger_payment_success(
-    order_id: uuid.UUID = Path(..., description="Order ID"),
-    _: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
-    """
-    Test trigger payment success.
-    For testing purposes, this endpoint will reset payment to WAITING_FOR_PURCHASE if it's in a terminal state.
-    """
-    try:
-        payment = db.query(Payment).filter(Payment.order_id == order_id).first()
-        if not payment:
-            raise HTTPException(status_code=404, detail="Payment not found")
-
-        # For test endpoints, reset payment to WAITING_FOR_PURCHASE if it's in a terminal state
-        # This allows testing transitions from any state
-        if payment.status in [PaymentStatus.SUCCESS, PaymentStatus.FAILED, PaymentStatus.CANCELLED]:
-            payment.status = PaymentStatus.WAITING_FOR_PURCHASE
-            db.add(payment)
-            db.commit()
-            db.refresh(payment)
-
-        # Call the operation directly to ensure synchronous execution and proper commits
-        result = PaymentOperation.update_payment_status_by_transaction_code(
-            transaction_code=payment.transaction_code,
-            status=PaymentStatus.SUCCESS.value,
-            provider=PaymentProvider.VIET_QR.value
+        total, orders = await run_in_threadpool(operation.execute)
+        data = serialize_rows(orders, OrderResponse)
+
+        if query_params.include_details:
+            # One query for the details of the whole page, not one per order.
+            order_details = await run_in_threadpool(
+                OrderDetailOperation.list_by_order_ids, [order["id"] for order in data]
+            )
+            details_by_order = {order["id"]: [] for order in data}
+            for order_detail in serialize_rows(order_details, OrderDetailResponse):
+                details_by_order[order_detail["order_id"]].append(order_detail)
+            for order in data:
+                order["order_details"] = details_by_order[order["id"]]
+
+        body = ORJSONResponse(build_paginated_response(query_params, total, data)).body
+        await run_in_threadpool(
+            order_cache.set_body, http_request, current_user.id, body, LIST_CACHE_TTL_SECONDS,
         )
-        
-        # Refresh the order to get updated status
-        db.expire_all()  # Expire all objects to force fresh query
-        order = db.query(Order).filter(Order.id == order_id).first()
-        
-        return { 
-            "success": True,
-            "order_status": order.status.value if order else None,
-            "payment_status": result.get("status")
-        }
-    except Exception as e:
-        logger.error(f"Error triggering payment success: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-@router.post("/{order_id}/trigger-payment-failed")
-async def test_trigger_payment_failed(
+
+    return Response(body, media_type="application/json", headers=LIST_CACHE_HEADERS)
+
+
+# For testing purposes: drive an order's payment to an outcome without the
+# payment provider. success/failed first reset a payment in a terminal state
+# to WAITING_FOR_PURCHASE so that transitions can be tested from any state.
+TRIGGER_PAYMENT_OUTCOMES = {
+    "success": (PaymentStatus.SUCCESS, True),
+    "failed": (PaymentStatus.FAILED, True),
+    "timeout": (PaymentStatus.CANCELLED, False),
+}
+
+
+@router.post("/{order_id}/trigger-payment-{outcome}")
+async def test_trigger_payment(
+    _: CurrentUser,
     order_id: uuid.UUID = Path(..., description="Order ID"),
-    _: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    outcome: Literal["success", "failed", "timeout"] = Path(..., description="Payment outcome"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Test trigger payment failed.
-    For testing purposes, this endpoint will reset payment to WAITING_FOR_PURCHASE if it's in a terminal state.
+    Test trigger payment success, failure or timeout.
     """
-    try:
-        payment = db.query(Payment).filter(Payment.order_id == order_id).first()
-        if not payment:
-            raise HTTPException(status_code=404, detail="Payment not found")
-
-        # For test endpoints, reset payment to WAITING_FOR_PURCHASE if it's in a terminal state
-        # This allows testing transitions from any state
-        if payment.status in [PaymentStatus.SUCCESS, PaymentStatus.FAILED, PaymentStatus.CANCELLED]:
-            payment.status = PaymentStatus.WAITING_FOR_PURCHASE
-            db.add(payment)
-            db.commit()
-            db.refresh(payment)
-
-        # Call the operation directly to ensure synchronous execution and proper commits
-        result = PaymentOperation.update_payment_status_by_transaction_code(
-            transaction_code=payment.transaction_code,
-            status=PaymentStatus.FAILED.value,
-            provider=PaymentProvider.VIET_QR.value
+    status, reset_terminal = TRIGGER_PAYMENT_OUTCOMES[outcome]
+
+    if reset_terminal:
+        # Reset and read the transaction code of the order's latest payment
+        # in one statement
+        latest_payment_id = (
+            select(Payment.id)
+            .where(Payment.order_id == order_id)
+            .order_by(Payment.created_at.desc())
+            .limit(1)
+            .scalar_subquery()
         )
-        
-        # Refresh the order to get updated status
-        db.expire_all()  # Expire all objects to force fresh query
-        order = db.query(Order).filter(Order.id == order_id).first()
-        
-        return { 
-            "success": True,
-            "order_status": order.status.value if order else None,
-            "payment_status": result.get("status")
-        }
-    except Exception as e:
-        logger.error(f"Error triggering payment failed: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-@router.post("/{order_id}/trigger-payment-timeout")
-async def test_trigger_payment_timeout(
-    order_id: uuid.UUID = Path(..., description="Order ID"),
-    _: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
-    """
-    Test trigger payment timeout.
-    """
-    try:
-        payment = db.query(Payment).filter(Payment.order_id == order_id).first()
-        if not payment:
-            raise HTTPException(status_code=404, detail="Payment not found")
-
-        # Call the operation directly to ensure synchronous execution and proper commits
-        result = PaymentOperation.update_payment_status_by_transaction_code(
-            transaction_code=payment.transaction_code,
-            status=PaymentStatus.CANCELLED.value,
-            provider=PaymentProvider.VIET_QR.value
+        transaction_code = await db.scalar(
+            update(Payment)
+            .where(Payment.id == latest_payment_id)
+            .values(status=case(
+                (
+                    Payment.status.in_([PaymentStatus.SUCCESS, PaymentStatus.FAILED, PaymentStatus.CANCELLED]),
+                    PaymentStatus.WAITING_FOR_PURCHASE,
+                ),
+                else_=Payment.status,
+            ))
+            .returning(Payment.transaction_code)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+    else:
+        transaction_code = await db.scalar(
+            select(Payment.transaction_code)
+            .where(Payment.order_id == order_id)
+            .order_by(Payment.created_at.desc())
+            .limit(1)
         )
-        
-        # Refresh the order to get updated status
-        db.expire_all()  # Expire all objects to force fresh query
-        order = db.query(Order).filter(Order.id == order_id).first()
-        
-        return { 
-            "success": True,
-            "order_status": order.status.value if order else None,
-            "payment_status": result.get("status")
-        }
-    except Exception as e:
-        logger.error(f"Error triggering payment timeout: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-@router.post("/{order_id}/sync-up")
+
+    if transaction_code is None:
+        raise HTTPException(status_code=404, detail="Payment not found")
+
+    # Call the operation directly to ensure synchronous execution and proper commits
+    result = await run_in_threadpool(
+        PaymentOperation.update_payment_status_by_transaction_code,
+        transaction_code=transaction_code,
+        status=status.value,
+        provider=PaymentProvider.VIET_QR.value
+    )
+    await run_in_threadpool(order_cache.evict)
+    
+    # A column select always reads the fresh status
+    order_status = await db.scalar(select(Order.status).where(Order.id == order_id))
+    
+    return { 
+        "success": True,
+        "order_status": order_status.value if order_status else None,
+        "payment_status": result.get("status")
+    }
+
+
+@router.post("/{order_id}/sync-up", status_code=202)
 async def sync_up_order(
+    current_user: CurrentUser,
     order_id: uuid.UUID = Path(..., description="Order ID"),
-    current_user: User = Depends(get_current_user),
 ):
     """
     Sync up order.
+
+    The sync runs on a Celery worker; the request only queues it.
     """
     if current_user.role == UserRole.CUSTOMER:
         raise HTTPException(status_code=403, detail="Forbidden")
 
-    try:
-        SyncUpOrderOperation.execute(order_id)
-        return { "success": True }
-    except Exception as e:
-        logger.error(f"Error syncing up order: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    await task_dispatcher.dispatch(sync_up_order_task, {"order_id": order_id})
+    return { "success": True }
 
 
 @router.post("/{order_id}/check-promotion", response_model=OrderResponse)
-async def check_promotion(
+def check_promotion(
+    current_user: CurrentUser,
     order_id: uuid.UUID = Path(..., description="Order ID"),
-    current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
@@ -251,31 +238,37 @@ async def check_promotion(
     This endpoint checks for applicable promotions and applies the best one to the order.
     Returns the final order with promotion details (sub_total, discount_amount, promotion_summary, total_amount).
     """
-    try:
-        order = OrderOperation.get_order_by_id(order_id)
-        if not order:
-            raise HTTPException(status_code=404, detail="Order not found")
+    # Load the entity into this session directly, so the operation's merge
+    # is an identity-map hit rather than another SELECT.
+    order = (
+        db.query(Order)
+        .filter(Order.id == order_id, Order.deleted_at.is_(None))
+        .first()
+    )
+    if not order:
+        raise HTTPException(status_code=404, detail="Order not found")
 
-        # Merge order into current session if it came from a different session
-        order = db.merge(order)
-        
+    try:
         order = CheckAndApplyPromotionOperation.execute(order, db=db)
-        
-        db.commit()
-        db.refresh(order)
-        
-        return order
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Error checking promotion: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    
+    # The UPDATE returns updated_at (eager_defaults), so no refresh is needed.
+    db.commit()
+    order_cache.evict()
+    
+    return order
 
 
-@router.get("/{order_id}", response_model=OrderResponse)
+@router.get(
+    "/{order_id}",
+    response_model=None,
+    responses={200: {"model": OrderResponse}},
+)
 async def get_order(
+    http_request: Request,
+    current_user: CurrentUser,
     order_id: uuid.UUID = Path(..., description="Order ID"),
-    _: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
@@ -283,11 +276,10 @@ async def get_order(
     
     Returns the order with all its details including promotion information (sub_total, discount_amount, promotion_summary, total_amount).
     """
-    try:
-        order = OrderOperation.get_order_by_id(order_id)
-        return order
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        logger.error(f"Error getting order: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    response = await run_in_threadpool(order_cache.get, http_request, current_user.id)
+    if response is None:
+        order = await run_in_threadpool(OrderOperation.get_order_by_id, order_id)
+        response = OrderResponse.model_construct(**order._mapping).model_dump(mode="json")
+        await run_in_threadpool(order_cache.set, http_request, current_user.id, response)
+
+    return etag_response(http_request, response)
@@ -7,117 +7,137 @@ creation, status updates, and integration with orders.
 
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, Path
-from sqlalchemy.dialects.postgresql.psycopg import logger
-from sqlalchemy.orm import Session
-
-from app.apis.deps import get_current_user
-from app.libs.database import get_db
-from app.models.user import User
+from fastapi import APIRouter, Depends, HTTPException, Path, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.apis.deps import CurrentUser
+from app.libs.database import get_async_db
+from app.libs.response_cache import ResponseCache
 from app.models.payment import Payment, PaymentStatus, PaymentProvider
 from app.operations.payment import PaymentOperation
-from app.operations.payment.generate_payment_details_operation import GeneratePaymentDetailsOperation
+from app.tasks.payment.generate_payment_details_task import generate_payment_details_task
 from app.tasks.payment.payment_tasks import sync_payment_transaction
 from app.schemas.payment import (
     InitializePaymentRequest,
     PaymentResponse,
 )
+from app.utils.responses import etag_response
 
 
 router = APIRouter()
 
+# Clients poll a payment while waiting for it to succeed. Payment operations
+# evict the group whenever a status or the details change.
+payment_cache = ResponseCache("payment", ttl_seconds=3)
+
 
 @router.post("", response_model=PaymentResponse, status_code=201)
 async def initialize_payment(
     request: InitializePaymentRequest,
-    user: User = Depends(get_current_user)
+    user: CurrentUser
 ):
     """
     Initialize a new payment.
     
     This endpoint creates a new payment for the specified order.
-    The payment will be created with NEW status.
+    The payment will be created with NEW status; its details (QR code, card
+    link) are generated by a Celery worker and can be read back with
+    GET /payment/{payment_id}.
     """
     try:
-        payment = PaymentOperation.initialize_payment(request, user.id)
-
-        operation = GeneratePaymentDetailsOperation(payment.id)
-        operation.execute()
-
-        return payment
+        payment = await run_in_threadpool(PaymentOperation.initialize_payment, request, user.id)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Internal server error")
+
+    # The payment row is committed by now, so the worker can load it.
+    # Full-discount payments are already settled; nothing to generate.
+    # Published inline rather than through the batching dispatcher: a
+    # payment whose details task is lost stays in NEW with nothing for the
+    # client to pay with, so a failed publish must fail the request.
+    if payment.needs_provider_details:
+        await run_in_threadpool(
+            generate_payment_details_task.apply_async,
+            kwargs={"payment_id": payment.id},
+        )
+
+    return payment
 
 
-@router.get("/{payment_id}", response_model=PaymentResponse)
+@router.get(
+    "/{payment_id}",
+    response_model=None,
+    responses={200: {"model": PaymentResponse}},
+)
 async def get_payment(
+    http_request: Request,
+    current_user: CurrentUser,
     payment_id: uuid.UUID = Path(..., description="Payment ID"),
-    _: User = Depends(get_current_user)
 ):
     """
     Get payment by ID.
     
     Returns the payment details including status and transaction information.
     """
-    try:
-        payment = PaymentOperation.get_payment_by_id(payment_id)
-        
-        return payment
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Internal server error")
+    response = await run_in_threadpool(payment_cache.get, http_request, current_user.id)
+    if response is None:
+        try:
+            payment = await run_in_threadpool(PaymentOperation.get_payment_by_id, payment_id)
+        except ValueError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+
+        response = PaymentResponse.model_validate(payment).model_dump(mode="json")
+        await run_in_threadpool(payment_cache.set, http_request, current_user.id, response)
+
+    return etag_response(http_request, response)
+
+
+async def _get_transaction_code(db: AsyncSession, payment_id: uuid.UUID) -> str | None:
+    return await db.scalar(select(Payment.transaction_code).where(Payment.id == payment_id))
 
 
 @router.post("/{payment_id}/timeout")
-def post_payment_timeout(
+async def post_payment_timeout(
+    _: CurrentUser,
     payment_id: uuid.UUID = Path(..., description="Payment ID"),
-    _: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Test trigger payment success.
     """
-    try:
-        payment = db.query(Payment).filter(Payment.id == payment_id).first()
-        if not payment:
-            raise HTTPException(status_code=404, detail="Payment not found")
-
-        sync_payment_transaction(
-            content=payment.transaction_code,
-            status=PaymentStatus.CANCELLED,
-            provider=PaymentProvider.VIET_QR
-        )
+    transaction_code = await _get_transaction_code(db, payment_id)
+    if transaction_code is None:
+        raise HTTPException(status_code=404, detail="Payment not found")
+
+    await run_in_threadpool(
+        sync_payment_transaction,
+        content=transaction_code,
+        status=PaymentStatus.CANCELLED,
+        provider=PaymentProvider.VIET_QR
+    )
 
-        return { "success": True }
-    except Exception as e:
-        logger.error(f"Error triggering payment timeout: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    return { "success": True }
 
 
 @router.post("/{payment_id}/test-trigger-payment-success")
 async def test_trigger_payment_success(
+    _: CurrentUser,
     payment_id: uuid.UUID = Path(..., description="Payment ID"),
-    _: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Test trigger payment success.
     """
-    try:
-        payment = db.query(Payment).filter(Payment.id == payment_id).first()
-        if not payment:
-            raise HTTPException(status_code=404, detail="Payment not found")
-
-        sync_payment_transaction(
-            content=payment.transaction_code,
-            status=PaymentStatus.SUCCESS,
-            provider=PaymentProvider.VIET_QR
-        )
-
-        return { "success": True }
-    except Exception as e:
-        logger.error(f"Error triggering payment success: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    transaction_code = await _get_transaction_code(db, payment_id)
+    if transaction_code is None:
+        raise HTTPException(status_code=404, detail="Payment not found")
+
+    await run_in_threadpool(
+        sync_payment_transaction,
+        content=transaction_code,
+        status=PaymentStatus.SUCCESS,
+        provider=PaymentProvider.VIET_QR
+    )
+
+    return { "success": True }
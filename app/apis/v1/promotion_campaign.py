@@ -2,9 +2,8 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Response
 from fastapi import status
-from app.apis.deps import get_current_user
+from app.apis.deps import CurrentUser
 from app.core.logging import logger
-from app.models.user import User
 from app.operations.promotion.promotion_base_operations import PromotionBaseOperations
 from app.operations.promotion.promotion_metadata.build_promotion_metadata_operation import BuildPromotionMetadataOperation
 from app.schemas.pagination import PaginatedResponse
@@ -22,7 +21,7 @@ router = APIRouter()
 
 @router.get("/metadata", response_model=PromotionMetadata)
 async def get_promotion_metadata(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ):
     try:
         return await BuildPromotionMetadataOperation(current_user).execute()
@@ -33,8 +32,8 @@ async def get_promotion_metadata(
 
 @router.get("", response_model=PaginatedResponse[PromotionCampaignSerializer])
 async def list_promotion_campaigns(
+    current_user: CurrentUser,
     query_params: ListPromotionCampaignQueryParams = Depends(),
-    current_user: User = Depends(get_current_user),
 ):
     try:
         total, promotion_campaigns = PromotionBaseOperations.list(current_user, query_params)
@@ -54,7 +53,7 @@ async def list_promotion_campaigns(
 @router.post("", response_model=PromotionCampaignSerializer)
 async def create_promotion_campaign(
     request: PromotionCampaignCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ):
     try:
         return PromotionBaseOperations.create(current_user, request)
@@ -66,7 +65,7 @@ async def create_promotion_campaign(
 @router.get("/{promotion_campaign_id}", response_model=PromotionCampaignSerializer)
 async def get_promotion_campaign(
     promotion_campaign_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ):
     try:
         promotion_campaign = PromotionBaseOperations.get(current_user, promotion_campaign_id)
@@ -80,7 +79,7 @@ async def get_promotion_campaign(
 async def update_partially_promotion_campaign(
     promotion_campaign_id: UUID,
     request: PromotionCampaignUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ):
     try:
         return PromotionBaseOperations.update_partially(current_user, promotion_campaign_id, request)
@@ -92,7 +91,7 @@ async def update_partially_promotion_campaign(
 @router.delete("/{promotion_campaign_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_promotion_campaign(
     promotion_campaign_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ):
     try:
         PromotionBaseOperations.delete(current_user, promotion_campaign_id)
@@ -105,7 +104,7 @@ async def delete_promotion_campaign(
 @router.post("/{promotion_campaign_id}/schedule", status_code=status.HTTP_204_NO_CONTENT)
 async def schedule_promotion_campaign(
     promotion_campaign_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ):
     try:
         PromotionBaseOperations.schedule(current_user, promotion_campaign_id)
@@ -118,7 +117,7 @@ async def schedule_promotion_campaign(
 @router.post("/{promotion_campaign_id}/pause", status_code=status.HTTP_204_NO_CONTENT)
 async def pause_promotion_campaign(
     promotion_campaign_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ):
     try:
         PromotionBaseOperations.pause(current_user, promotion_campaign_id)
@@ -131,7 +130,7 @@ async def pause_promotion_campaign(
 @router.post("/{promotion_campaign_id}/resume", status_code=status.HTTP_204_NO_CONTENT)
 async def resume_promotion_campaign(
     promotion_campaign_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ):
     try:
         PromotionBaseOperations.resume(current_user, promotion_campaign_id)
@@ -4,7 +4,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from app.apis.deps import get_current_user, require_permissions
+from app.apis.deps import CurrentUser, require_permissions
 from app.core.logging import logger
 from app.libs.database import get_db
 from app.models.user import User
@@ -40,7 +40,7 @@ router = APIRouter()
 @router.post("", response_model=StoreSerializer)
 def create_store(
     request: AddStoreRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ):
     try:
         return StoreOperation.create(current_user, request)
@@ -121,7 +121,7 @@ def delete_store(
 @router.get("/{store_id}/classified-machines", response_model=ClassifiedMachinesResponse)
 def classified_machines(
     store_id: UUID,
-    _: User = Depends(get_current_user),
+    _: CurrentUser,
 ):
     try:
         washers, dryers = StoreMachineOperation.classify_machines(store_id)
@@ -137,7 +137,7 @@ def classified_machines(
 @router.get("/{store_id}/payment-methods", response_model=List[StorePaymentMethod])
 def get_store_payment_methods(
     store_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ):
     try:
         return GetStorePaymentMethodsOperation(current_user, store_id).execute()
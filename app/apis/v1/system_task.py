@@ -8,13 +8,12 @@ CRUD operations, status updates, and task retrieval.
 from uuid import UUID
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import APIRouter, HTTPException, Path, Query
 from sqlalchemy.orm import Session
 
-from app.apis.deps import get_current_user
+from app.apis.deps import CurrentUser
 from app.core.logging import logger
 from app.libs.database import get_db
-from app.models.user import User
 from app.models.system_task import SystemTaskStatus
 from app.enums.system_task_type_enum import SystemTaskTypeEnum
 from app.operations.system_task_operation import SystemTaskOperation
@@ -29,7 +28,7 @@ router = APIRouter()
 @router.post("", response_model=SystemTaskSerializer, status_code=201)
 async def create_system_task(
     request: CreateSystemTaskRequest,
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser
 ):
     """
     Create a new system task.
@@ -53,8 +52,8 @@ async def create_system_task(
 
 @router.get("/{task_id}", response_model=SystemTaskSerializer)
 async def get_system_task(
+    current_user: CurrentUser,
     task_id: UUID = Path(..., description="System task ID"),
-    current_user: User = Depends(get_current_user)
 ):
     """
     Get a system task by ID.
@@ -3,6 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.apis.deps import require_permissions
+from app.apis.v1.auth.profile import profile_cache
 from app.libs.database import get_db
 from app.models.user import User
 from app.operations.tenant.list_tenants import ListTenantsOperation
@@ -90,6 +91,7 @@ def update_tenant(
     try:
         operation = UpdateTenantOperation(db, current_user, tenant_id, request)
         tenant = operation.execute()
+        profile_cache.evict()
         return tenant
     except PermissionError:
         raise HTTPException(status_code=403)
@@ -107,6 +109,7 @@ def delete_tenant(
     try:
         operation = DeleteTenantOperation(db, current_user, tenant_id)
         operation.execute()
+        profile_cache.evict()
     except PermissionError:
         raise HTTPException(status_code=403)
     except Exception as e:
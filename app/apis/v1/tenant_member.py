@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.apis.deps import require_permissions
+from app.apis.v1.auth.profile import profile_cache
 from app.libs.database import get_db
 from app.core.logging import logger
 from app.models.user import User
@@ -25,6 +26,7 @@ def add_tenant_member(
 ):
     try:
         tenant_member = TenantMemberOperation.add(current_user, request)
+        profile_cache.evict()
         tenant_member = TenantMemberOperation.get(current_user, tenant_member.id)
         return tenant_member
     except PermissionError as e:
@@ -67,6 +69,7 @@ def delete_tenant_member(
     try:
         operation = DeleteTenantMemberOperation(db, current_user, tenant_member_id)
         operation.execute()
+        profile_cache.evict()
     except PermissionError as e:
         raise HTTPException(status_code=403)
     except Exception as e:
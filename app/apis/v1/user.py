@@ -1,8 +1,8 @@
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
-from app.core.logging import logger
 from app.libs.database import get_db
 from app.models.user import User
 from app.operations.user.create_user import CreateUserOperation
@@ -19,7 +19,8 @@ from app.schemas.user import (
     ListNotificationsQueryParams,
     ListAvailableUserTenantAdminsRequest,
 )
-from app.apis.deps import get_current_user, require_permissions
+from app.apis.deps import CurrentUser, require_permissions
+from app.apis.v1.auth.profile import profile_cache
 from app.operations.permission.get_user_permissions import GetUserPermissionsOperation
 from app.operations.user.user_operation import UserOperation
 from app.operations.user.assign_member_to_store import AssignMemberToStoreOperation
@@ -36,14 +37,15 @@ from app.utils.pagination import get_total_pages
 router = APIRouter()
 
 
-@router.get("/me")
-def get_me(current_user: User = Depends(get_current_user)):
-    return current_user.to_dict()
+@router.get("/me", responses={200: {"model": UserSerializer}})
+def get_me(current_user: CurrentUser):
+    # to_dict() is already JSON-ready; skip FastAPI's jsonable_encoder pass.
+    return ORJSONResponse(current_user.to_dict())
 
 
 @router.get("/me/permissions", response_model=UserPermissionSerializer)
 def get_me_permissions(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
     db: Session = Depends(get_db),
 ):
     permissions = GetUserPermissionsOperation().execute(db, current_user)
@@ -54,76 +56,59 @@ def get_me_permissions(
     "/me/notifications", response_model=PaginatedResponse[NotificationSerializer]
 )
 def list_notifications(
+    current_user: CurrentUser,
     query_params: ListNotificationsQueryParams = Depends(),
-    current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    try:
-        operation = ListNotificationsOperation(db, current_user, query_params)
-        total, notifications = operation.execute()
+    operation = ListNotificationsOperation(db, current_user, query_params)
+    total, notifications = operation.execute()
 
-        return PaginatedResponse(
-            page=query_params.page,
-            page_size=query_params.page_size,
-            total=total,
-            total_pages=get_total_pages(total, query_params.page_size),
-            data=notifications,
-        )
-    except Exception as e:
-        logger.error("List notifications failed", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+    return PaginatedResponse(
+        page=query_params.page,
+        page_size=query_params.page_size,
+        total=total,
+        total_pages=get_total_pages(total, query_params.page_size),
+        data=notifications,
+    )
 
 
 @router.post("/me/notifications/clear", status_code=status.HTTP_204_NO_CONTENT)
 def clear_all_notifications(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
     db: Session = Depends(get_db),
 ):
-    try:
-        operation = ClearAllNotificationsOperation(db, current_user)
-        operation.execute()
-    except Exception as e:
-        logger.error("Clear all notifications failed", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+    operation = ClearAllNotificationsOperation(db, current_user)
+    operation.execute()
 
 
 @router.get(
     "/available-tenant-admins", response_model=PaginatedResponse[UserSerializer]
 )
 def list_available_tenant_admins(
+    current_user: CurrentUser,
     request: ListAvailableUserTenantAdminsRequest = Depends(),
-    current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    try:
-        operation = ListAvailableUserTenantAdminsOperation(db, current_user, request)
-        total, users = operation.execute()
+    operation = ListAvailableUserTenantAdminsOperation(db, current_user, request)
+    total, users = operation.execute()
 
-        return PaginatedResponse(
-            page=request.page,
-            page_size=request.page_size,
-            total=total,
-            total_pages=get_total_pages(total, request.page_size),
-            data=users,
-        )
-    except Exception as e:
-        logger.error("List available tenant admins failed", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+    return PaginatedResponse(
+        page=request.page,
+        page_size=request.page_size,
+        total=total,
+        total_pages=get_total_pages(total, request.page_size),
+        data=users,
+    )
 
 
 @router.post("/{user_id}/reset-password", response_model=UserSerializer)
 def reset_password(
     user_id: str,
     request: ResetPasswordRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ):
-    try:
-        user = UserOperation.reset_password(current_user, user_id, request)
-        return user
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    user = UserOperation.reset_password(current_user, user_id, request)
+    return user
 
 
 @router.post("", status_code=status.HTTP_201_CREATED, response_model=UserSerializer)
@@ -138,37 +123,26 @@ def create_user(
         return user
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/{user_id}", response_model=UserSerializer)
 def get_user(
     user_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ):
-    try:
-        user = UserOperation.get(current_user, user_id)
-        return user
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    user = UserOperation.get(current_user, user_id)
+    return user
 
 
 @router.patch("/{user_id}", response_model=UserSerializer)
 def update_user(
     user_id: str,
     request: UpdateUserRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ):
-    try:
-        user = UserOperation.update_partially(current_user, user_id, request)
-        return user
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    user = UserOperation.update_partially(current_user, user_id, request)
+    profile_cache.evict()
+    return user
 
 
 @router.get(
@@ -176,26 +150,20 @@ def update_user(
 )
 def list_assigned_stores(
     user_id: str,
+    current_user: CurrentUser,
     query_params: ListAssignedStoresQueryParams = Depends(),
-    current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    try:
-        operation = ListAssignedStoresOperation(current_user, user_id, query_params)
-        total, stores = operation.execute(db)
-
-        return {
-            "page": query_params.page,
-            "page_size": query_params.page_size,
-            "total": total,
-            "total_pages": get_total_pages(total, query_params.page_size),
-            "data": stores,
-        }
-    except PermissionError as e:
-        raise HTTPException(status_code=403, detail=str(e))
-    except Exception as e:
-        logger.error("List assigned stores failed", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+    operation = ListAssignedStoresOperation(current_user, user_id, query_params)
+    total, stores = operation.execute(db)
+
+    return {
+        "page": query_params.page,
+        "page_size": query_params.page_size,
+        "total": total,
+        "total_pages": get_total_pages(total, query_params.page_size),
+        "data": stores,
+    }
 
 
 @router.post("/{user_id}/assign-member-to-stores", status_code=status.HTTP_201_CREATED)
@@ -205,18 +173,10 @@ def assign_member_to_store(
     current_user: User = Depends(require_permissions(["store_member.create"])),
     db: Session = Depends(get_db),
 ):
-    try:
-        operation = AssignMemberToStoreOperation(
-            current_user, user_id, request.store_ids
-        )
-        operation.execute(db)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except PermissionError as e:
-        raise HTTPException(status_code=403, detail=str(e))
-    except Exception as e:
-        logger.error("Assign member to store failed", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+    operation = AssignMemberToStoreOperation(
+        current_user, user_id, request.store_ids
+    )
+    operation.execute(db)
 
 
 @router.delete(
@@ -228,13 +188,5 @@ def delete_assigned_store(
     current_user: User = Depends(require_permissions(["store_member.delete"])),
     db: Session = Depends(get_db),
 ):
-    try:
-        operation = DeleteAssignedStoreOperation(current_user, user_id, store_id)
-        operation.execute(db)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except PermissionError as e:
-        raise HTTPException(status_code=403, detail=str(e))
-    except Exception as e:
-        logger.error("Delete assigned store failed", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+    operation = DeleteAssignedStoreOperation(current_user, user_id, store_id)
+    operation.execute(db)
@@ -2,12 +2,17 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.apis.exception_handlers import register_exception_handlers
 from app.apis.router import router as api_router
 from app.bootstrap.common import bootstrap_services, shutdown_services
 from app.core.config import settings
 from app.libs import mqtt
+from app.libs.cache import close_async_redis
+from app.libs.database import close_async_engine
+from app.libs.task_dispatcher import task_dispatcher
 
 TITLE = f"{settings.APP_NAME}_api"
 
@@ -17,6 +22,7 @@ def init() -> FastAPI:
         title=TITLE,
         lifespan=lifespan,
         redirect_slashes=True,  # Enable automatic trailing slash redirects
+        default_response_class=ORJSONResponse,
     )
 
     # Add CORS middleware first, before any other middleware
@@ -28,6 +34,7 @@ def init() -> FastAPI:
         allow_headers=["*"],
         expose_headers=["*"],
     )
+    register_exception_handlers(app)
     app.include_router(api_router)
 
     return app
@@ -36,9 +43,13 @@ def init() -> FastAPI:
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     bootstrap_services(app=_app, custom_callback=on_startup)
+    task_dispatcher.start()
     try:
         yield
     finally:
+        await task_dispatcher.stop()
+        await close_async_engine()
+        await close_async_redis()
         shutdown_services(app=_app, custom_callback=on_shutdown)
 
 
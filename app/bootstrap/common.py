@@ -5,7 +5,7 @@ import os
 from fastapi import FastAPI
 
 from app.core.config import settings
-from app.core.logging import logger
+from app.core.logging import configure_logging, logger
 from app.libs.database import db_manager
 from app.libs.cache import cache_manager
 
@@ -14,8 +14,8 @@ def bootstrap_services(
     app: FastAPI = None,
     custom_callback: Callable = None,
 ):
-    logger.info("starting", app=settings.APP_NAME)
     init_timezone_and_logging()
+    logger.info("starting", app=settings.APP_NAME)
     
     # Initialize database
     init_database()
@@ -50,6 +50,8 @@ def init_timezone_and_logging():
     except AttributeError:
         pass
 
+    configure_logging(settings.LOG_LEVEL)
+
 
 def init_database():
     """Initialize the database connection and create tables if needed."""
@@ -1,5 +1,6 @@
 import logging
 import sys
+import orjson
 import structlog
 
 from app.utils.timezone import iso_now_local
@@ -16,11 +17,19 @@ def configure_logging(level: str = "INFO"):
         event_dict["timestamp"] = iso_now_local()
         return event_dict
 
+    def orjson_dumps(event_dict, **_kwargs) -> str:
+        # default=str stringifies exceptions and other values passed as-is,
+        # so callers can hand over `error=e` and only pay for it here.
+        return orjson.dumps(event_dict, default=str).decode()
+
     structlog.configure(
         processors=[
+            # Drop records below the configured level before any processor
+            # (or value stringification) runs.
+            structlog.stdlib.filter_by_level,
             structlog.processors.add_log_level,
             add_timestamp_processor,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=orjson_dumps),
         ],
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
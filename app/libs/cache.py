@@ -10,6 +10,7 @@ import logging
 from typing import Any, List, Optional
 
 import redis
+import redis.asyncio as aioredis
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -111,6 +112,48 @@ class CacheManager:
             logger.error(f"Failed to get cache key {key}: {e}")
             return None
     
+    def set_raw(self, key: str, value: str, ttl_seconds: int = 900) -> bool:
+        """
+        Set an already serialized value in cache with TTL.
+        
+        Args:
+            key: Cache key
+            value: Serialized value, stored as is
+            ttl_seconds: Time to live in seconds (default: 15 minutes)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.is_connected():
+            logger.warning("Redis not connected, skipping cache set")
+            return False
+        
+        try:
+            return bool(self.redis_client.setex(key, ttl_seconds, value))
+        except Exception as e:
+            logger.error(f"Failed to set cache key {key}: {e}")
+            return False
+    
+    def get_raw(self, key: str) -> Optional[str]:
+        """
+        Get a value from cache without deserializing it.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached value or None if not found/expired
+        """
+        if not self.is_connected():
+            logger.warning("Redis not connected, skipping cache get")
+            return None
+        
+        try:
+            return self.redis_client.get(key)
+        except Exception as e:
+            logger.error(f"Failed to get cache key {key}: {e}")
+            return None
+    
     def delete(self, key: str) -> bool:
         """
         Delete a key from cache.
@@ -131,7 +174,27 @@ class CacheManager:
         except Exception as e:
             logger.error(f"Failed to delete cache key {key}: {e}")
             return False
-    
+
+    def incr(self, key: str) -> Optional[int]:
+        """
+        Atomically increment an integer counter, starting from 0.
+
+        Args:
+            key: Counter key
+
+        Returns:
+            The new value, or None if Redis is unavailable
+        """
+        if not self.is_connected():
+            logger.warning("Redis not connected, skipping cache incr")
+            return None
+
+        try:
+            return self.redis_client.incr(key)
+        except Exception as e:
+            logger.error(f"Failed to increment cache key {key}: {e}")
+            return None
+
     def exists(self, key: str) -> bool:
         """
         Check if a key exists in cache.
@@ -224,7 +287,8 @@ class CacheManager:
             return 0
         
         try:
-            keys = self.redis_client.keys(pattern)
+            # SCAN instead of KEYS so a large keyspace does not block Redis.
+            keys = list(self.redis_client.scan_iter(match=pattern, count=500))
             if keys:
                 result = self.redis_client.delete(*keys)
                 logger.info(f"Cleared {result} keys matching pattern: {pattern}")
@@ -239,6 +303,43 @@ class CacheManager:
 cache_manager = CacheManager()
 
 
+ASYNC_REDIS_MAX_CONNECTIONS = 200
+
+_async_redis_client: Optional[aioredis.Redis] = None
+
+
+def get_async_redis() -> aioredis.Redis:
+    """
+    Get or create the process-wide asyncio Redis client.
+
+    Every caller shares one connection pool, so async code paths neither
+    open a connection per call nor block the event loop on the sync client.
+    """
+    global _async_redis_client
+    if _async_redis_client is None:
+        pool = aioredis.ConnectionPool(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            username=settings.REDIS_USERNAME if settings.REDIS_USERNAME else None,
+            password=settings.REDIS_PASSWORD if settings.REDIS_PASSWORD else None,
+            decode_responses=True,
+            socket_connect_timeout=5,
+            socket_timeout=5,
+            retry_on_timeout=True,
+            max_connections=ASYNC_REDIS_MAX_CONNECTIONS,
+        )
+        _async_redis_client = aioredis.Redis(connection_pool=pool)
+    return _async_redis_client
+
+
+async def close_async_redis() -> None:
+    """Close the asyncio Redis client and its connection pool."""
+    global _async_redis_client
+    if _async_redis_client is not None:
+        await _async_redis_client.aclose(close_connection_pool=True)
+        _async_redis_client = None
+
+
 # Convenience functions for global cache manager
 def set_cache(key: str, value: Any, ttl_seconds: int = 900) -> bool:
     """Set a value in cache with TTL."""
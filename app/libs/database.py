@@ -10,13 +10,15 @@ This module provides:
 """
 
 import functools
-from contextlib import contextmanager
-from typing import Any, Callable, Generator, Optional, TypeVar
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncGenerator, Callable, Generator, Optional, TypeVar
 from sqlalchemy import create_engine, text, event
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session, scoped_session
 from sqlalchemy.pool import QueuePool
+from starlette.exceptions import HTTPException
 
 from app.core.config import settings
 from app.core.logging import logger
@@ -32,6 +34,18 @@ Base = declarative_base()
 _engine: Optional[Engine] = None
 _session_factory: Optional[sessionmaker] = None
 _scoped_session_factory: Optional[scoped_session] = None
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+_async_read_only_engine: Optional[AsyncEngine] = None
+_async_read_only_session_factory: Optional[async_sessionmaker] = None
+
+# Hard cap for queries on the read-only engine, so a regressed plan on a hot
+# read endpoint fails fast instead of holding a connection.
+READ_ONLY_STATEMENT_TIMEOUT_MS = 2000
+
+# Raised by routes and operations to produce a client response (mapped by the
+# app-level exception handlers); rolled back but not logged as database errors.
+_CLIENT_ERRORS = (HTTPException, ValueError, PermissionError)
 
 DATABASE_URL = (
     f"{settings.DATABASE_DRIVER}"
@@ -42,6 +56,16 @@ DATABASE_URL = (
     f"/{settings.DATABASE_NAME}"
 )
 
+# Same database, reached through asyncpg for the async session API.
+ASYNC_DATABASE_URL = (
+    f"{settings.DATABASE_DRIVER.split('+')[0]}+asyncpg"
+    f"://{settings.DATABASE_USER}"
+    f":{settings.DATABASE_PASSWORD}"
+    f"@{settings.DATABASE_HOST}"
+    f":{settings.DATABASE_PORT}"
+    f"/{settings.DATABASE_NAME}"
+)
+
 
 def get_engine() -> Engine:
     """Get or create the database engine."""
@@ -100,6 +124,89 @@ def get_scoped_session_factory() -> scoped_session:
     return _scoped_session_factory
 
 
+def get_async_engine() -> AsyncEngine:
+    """Get or create the asyncio database engine."""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            ASYNC_DATABASE_URL,
+            pool_size=5,
+            max_overflow=10,
+            pool_pre_ping=True,
+            pool_recycle=3600,
+            echo=settings.LOG_LEVEL.upper() == "DEBUG",
+            # PostgreSQL should store datetimes in UTC
+            connect_args={"server_settings": {"timezone": "UTC"}},
+        )
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """Get or create the asyncio session factory."""
+    global _async_session_factory
+    if _async_session_factory is None:
+        _async_session_factory = async_sessionmaker(
+            bind=get_async_engine(),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_session_factory
+
+
+def get_async_read_only_engine() -> AsyncEngine:
+    """
+    Get or create the asyncio engine for read-only endpoints.
+
+    Its connections open every transaction read-only and carry a statement
+    timeout, both set once at connect time. It has its own pool, so reads
+    do not compete with writes for connections.
+    """
+    global _async_read_only_engine
+    if _async_read_only_engine is None:
+        _async_read_only_engine = create_async_engine(
+            ASYNC_DATABASE_URL,
+            pool_size=10,
+            max_overflow=20,
+            pool_pre_ping=True,
+            pool_recycle=3600,
+            echo=settings.LOG_LEVEL.upper() == "DEBUG",
+            connect_args={
+                "server_settings": {
+                    "timezone": "UTC",
+                    "default_transaction_read_only": "on",
+                    "statement_timeout": str(READ_ONLY_STATEMENT_TIMEOUT_MS),
+                }
+            },
+        )
+    return _async_read_only_engine
+
+
+def get_async_read_only_session_factory() -> async_sessionmaker:
+    """Get or create the asyncio session factory for read-only endpoints."""
+    global _async_read_only_session_factory
+    if _async_read_only_session_factory is None:
+        _async_read_only_session_factory = async_sessionmaker(
+            bind=get_async_read_only_engine(),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_read_only_session_factory
+
+
+async def close_async_engine() -> None:
+    """Close all connections held by the asyncio engines that were created."""
+    global _async_engine, _async_session_factory
+    global _async_read_only_engine, _async_read_only_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _async_session_factory = None
+    if _async_read_only_engine is not None:
+        await _async_read_only_engine.dispose()
+        _async_read_only_engine = None
+        _async_read_only_session_factory = None
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     FastAPI dependency for getting a database session.
@@ -112,6 +219,11 @@ def get_db() -> Generator[Session, None, None]:
     session = get_session_factory()()
     try:
         yield session
+    except _CLIENT_ERRORS:
+        # Raised by the route or another dependency (e.g. a 401 from the
+        # auth dependency sharing this session), not by the database.
+        session.rollback()
+        raise
     except Exception as e:
         logger.error("Database session error", error=str(e), exc_info=True)
         session.rollback()
@@ -120,6 +232,47 @@ def get_db() -> Generator[Session, None, None]:
         session.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency for getting an asyncio database session.
+    
+    Usage in FastAPI endpoints:
+        @app.get("/users/")
+        async def get_users(db: AsyncSession = Depends(get_async_db)):
+            return (await db.execute(select(User))).scalars().all()
+    """
+    async with _async_session_scope(get_async_session_factory()) as session:
+        yield session
+
+
+async def get_async_read_only_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency for a read-only asyncio database session, for GET
+    endpoints. Writes fail and statements are cut off after
+    READ_ONLY_STATEMENT_TIMEOUT_MS.
+    """
+    async with _async_session_scope(get_async_read_only_session_factory()) as session:
+        yield session
+
+
+@asynccontextmanager
+async def _async_session_scope(
+    session_factory: async_sessionmaker,
+) -> AsyncGenerator[AsyncSession, None]:
+    session = session_factory()
+    try:
+        yield session
+    except _CLIENT_ERRORS:
+        await session.rollback()
+        raise
+    except Exception as e:
+        logger.error("Database session error", error=str(e), exc_info=True)
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
 @contextmanager
 def get_db_session() -> Generator[Session, None, None]:
     """
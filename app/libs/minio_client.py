@@ -1,3 +1,4 @@
+import functools
 import io
 import minio
 from minio.datatypes import Object
@@ -7,6 +8,24 @@ from typing import BinaryIO, Union
 from app.core.config import settings
 
 
+# Uploads larger than one part go out as a multipart upload, with this many
+# parts in flight at once.
+UPLOAD_PART_SIZE = 16 * 1024 * 1024
+UPLOAD_PARALLELISM = 4
+
+
+@functools.lru_cache(maxsize=None)
+def _get_minio(endpoint: str, access_key: str, secret_key: str) -> minio.Minio:
+    # minio.Minio owns a urllib3 pool and is thread-safe; sharing it keeps
+    # connections alive across operations instead of reconnecting each time.
+    return minio.Minio(
+        endpoint=endpoint,
+        access_key=access_key,
+        secret_key=secret_key,
+        secure=False,
+    )
+
+
 class MinioClient:
     def __init__(
         self,
@@ -15,12 +34,7 @@ class MinioClient:
         secret_key: str = settings.MINIO_SECRET_KEY,
         secure: bool = settings.MINIO_SECURE,
     ):
-        self.minio_client = minio.Minio(
-            endpoint=endpoint,
-            access_key=access_key,
-            secret_key=secret_key,
-            secure=False,
-        )
+        self.minio_client = _get_minio(endpoint, access_key, secret_key)
         
     def upload_file(
         self,
@@ -39,6 +53,8 @@ class MinioClient:
             object_name=object_name,
             data=data,
             length=length,
+            part_size=UPLOAD_PART_SIZE,
+            num_parallel_uploads=UPLOAD_PARALLELISM,
         )
 
     def get_file_metadata(self, bucket_name: str, object_name: str) -> Object:
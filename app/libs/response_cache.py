@@ -0,0 +1,85 @@
+"""
+Per-user response cache backed by Redis.
+
+Read endpoints whose data changes rarely can keep their serialized response
+in Redis for a short while. Entries are grouped (e.g. "controller") so that a
+write to that resource can evict every cached response of the group at once:
+each group has a version counter that is part of every key, and evicting
+bumps it, so the old entries are never read again and expire on their TTL.
+Endpoints that render their own bytes can cache the body itself with
+get_body/set_body and serve it back without serializing again.
+"""
+
+from typing import Any, Optional
+from uuid import UUID
+
+from fastapi import Request
+
+from app.libs.cache import cache_manager
+
+
+class ResponseCache:
+    KEY_PREFIX: str = "response"
+
+    def __init__(self, group: str, ttl_seconds: int):
+        self.group = group
+        self.ttl_seconds = ttl_seconds
+
+    def build_key(self, request: Request, user_id: UUID) -> str:
+        version = cache_manager.get_raw(_version_key(self.group)) or "0"
+        query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+        return f"{self.KEY_PREFIX}:{self.group}:{version}:{user_id}:{request.url.path}?{query}"
+
+    def get(self, request: Request, user_id: UUID) -> Optional[Any]:
+        # Clients can ask for fresh data explicitly.
+        if "no-cache" in request.headers.get("cache-control", ""):
+            return None
+        return cache_manager.get(self.build_key(request, user_id))
+
+    def set(
+        self,
+        request: Request,
+        user_id: UUID,
+        value: Any,
+        ttl_seconds: Optional[int] = None,
+    ) -> None:
+        cache_manager.set(
+            self.build_key(request, user_id),
+            value,
+            ttl_seconds or self.ttl_seconds,
+        )
+
+    def get_body(self, request: Request, user_id: UUID) -> Optional[bytes]:
+        if "no-cache" in request.headers.get("cache-control", ""):
+            return None
+        body = cache_manager.get_raw(self.build_key(request, user_id))
+        return body.encode() if body is not None else None
+
+    def set_body(
+        self,
+        request: Request,
+        user_id: UUID,
+        body: bytes,
+        ttl_seconds: Optional[int] = None,
+    ) -> None:
+        cache_manager.set_raw(
+            self.build_key(request, user_id),
+            body.decode(),
+            ttl_seconds or self.ttl_seconds,
+        )
+
+    def evict(self) -> None:
+        evict_response_cache(self.group)
+
+
+def _version_key(group: str) -> str:
+    return f"{ResponseCache.KEY_PREFIX}:version:{group}"
+
+
+def evict_response_cache(group: str) -> None:
+    """
+    Evict every cached response of `group`. For operations that change a
+    resource outside its router (workers, webhooks, other operations).
+    A single INCR, so it costs the same however many entries are cached.
+    """
+    cache_manager.incr(_version_key(group))
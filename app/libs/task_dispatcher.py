@@ -0,0 +1,109 @@
+"""
+Background Celery Dispatcher
+
+Publishing a Celery task is a round-trip to the broker. This module lets API
+handlers hand a task off to an in-process queue instead, so the publish
+happens on a worker coroutine after the response has been sent. Tasks queued
+in a short window are published together over one producer. Celery still
+owns delivery, retries and execution.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from celery import Task, group
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.logging import logger
+
+
+QueuedTask = Tuple[Task, Dict[str, Any]]
+
+
+class TaskDispatcher:
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        batch_size: int = 50,
+        flush_interval_seconds: float = 0.1,
+    ):
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._worker = asyncio.create_task(self._run())
+        logger.info("Task dispatcher started")
+
+    async def stop(self) -> None:
+        if not self.is_running:
+            return
+        # Publish whatever is still queued before shutting down.
+        await self._queue.join()
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+        logger.info("Task dispatcher stopped")
+
+    async def dispatch(self, task: Task, kwargs: Dict[str, Any]) -> None:
+        """
+        Queue `task` to be published with `kwargs`.
+
+        Falls back to publishing inline when the dispatcher is not running
+        (e.g. outside the API process) or the queue is full.
+        """
+        if self.is_running:
+            try:
+                self._queue.put_nowait((task, kwargs))
+                return
+            except asyncio.QueueFull:
+                logger.warning("Task dispatcher queue full, publishing inline", task=task.name)
+
+        await run_in_threadpool(task.apply_async, kwargs=kwargs)
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            # Let a burst accumulate so it goes out in one publish.
+            await asyncio.sleep(self.flush_interval_seconds)
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                await run_in_threadpool(self._publish, batch)
+            except Exception as e:
+                logger.error("Failed to publish tasks", count=len(batch), error=str(e))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _publish(self, batch: List[QueuedTask]) -> None:
+        kwargs_by_task: Dict[str, Tuple[Task, List[Dict[str, Any]]]] = {}
+        for task, kwargs in batch:
+            kwargs_by_task.setdefault(task.name, (task, []))[1].append(kwargs)
+
+        for task, kwargs_list in kwargs_by_task.values():
+            if len(kwargs_list) == 1:
+                task.apply_async(kwargs=kwargs_list[0])
+            else:
+                # A group publishes every message over a single producer; the
+                # tasks still run independently on the workers.
+                group(task.s(**kwargs) for kwargs in kwargs_list).apply_async()
+
+
+task_dispatcher = TaskDispatcher()
@@ -8,6 +8,7 @@ from sqlalchemy import (
     DateTime,
     Enum as SQLEnum,
     ForeignKey,
+    Index,
     String,
     Integer,
     Numeric,
@@ -69,6 +70,10 @@ class Machine(Base):
     order_details = relationship("OrderDetail", back_populates="machine")
     datapoints = relationship("Datapoint", back_populates="machine")
 
+    __table_args__ = (
+        Index('ix_machines_created_at_id', 'created_at', 'id'),
+    )
+
     @validates('controller_id')
     def validate_controller_id(self, key: str, controller_id) -> uuid.UUID:
         if not isinstance(controller_id, uuid.UUID):
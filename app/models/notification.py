@@ -8,6 +8,8 @@ from sqlalchemy import (
     func,
     ForeignKey,
     Enum as SQLEnum,
+    Index,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship, validates
@@ -64,6 +66,14 @@ class Notification(Base):
     # Relationships
     user = relationship("User", back_populates="notifications")
 
+    __table_args__ = (
+        Index(
+            'ix_notifications_user_id_unseen',
+            'user_id',
+            postgresql_where=text("status <> 'SEEN'"),
+        ),
+    )
+
     @validates('user_id')
     def validate_user_id(self, key: str, user_id) -> uuid.UUID:
         if not isinstance(user_id, uuid.UUID):
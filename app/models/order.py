@@ -8,12 +8,14 @@ from sqlalchemy import (
     DateTime,
     Enum as SQLEnum,
     ForeignKey,
+    Index,
     String,
     Integer,
     Numeric,
     JSON,
     func,
     event,
+    inspect,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import validates, relationship
@@ -81,6 +83,15 @@ class Order(Base):
     payments = relationship("Payment", back_populates="order", cascade="all, delete-orphan")
     promotion_orders = relationship("PromotionOrder", back_populates="order", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index('ix_orders_created_at_id', 'created_at', 'id'),
+        Index('ix_orders_store_id_status_created_at', 'store_id', 'status', 'created_at'),
+    )
+
+    # Fetch server-side defaults (updated_at) through INSERT/UPDATE ...
+    # RETURNING, so a flushed order can be serialized without a refresh.
+    __mapper_args__ = {"eager_defaults": True}
+
     @validates('status')
     def validate_status(self, key: str, status) -> OrderStatus:
         if not isinstance(status, OrderStatus):
@@ -186,6 +197,13 @@ class Order(Base):
     def is_deleted(self) -> bool:
         return self.deleted_at is not None
 
+    @property
+    def store_name(self) -> Optional[str]:
+        """Store name for OrderResponse; None unless the store is already loaded"""
+        if "store" in inspect(self).unloaded:
+            return None
+        return self.store.name if self.store else None
+
     @property
     def can_be_cancelled(self) -> bool:
         """Check if order can be cancelled"""
@@ -297,6 +315,10 @@ class OrderDetail(Base):
     machine = relationship("Machine", back_populates="order_details")
     order = relationship("Order", back_populates="order_details")
 
+    __table_args__ = (
+        Index('ix_order_details_created_at_id', 'created_at', 'id'),
+    )
+
     @validates('status')
     def validate_status(self, key: str, status) -> OrderDetailStatus:
         if not isinstance(status, OrderDetailStatus):
@@ -388,6 +410,30 @@ class OrderDetail(Base):
     def is_deleted(self) -> bool:
         return self.deleted_at is not None
 
+    @property
+    def machine_name(self) -> Optional[str]:
+        """Machine name for OrderDetailResponse; None unless the machine is already loaded"""
+        machine = self._loaded_machine
+        return machine.name if machine else None
+
+    @property
+    def machine_relay_no(self) -> Optional[int]:
+        machine = self._loaded_machine
+        return machine.relay_no if machine else None
+
+    @property
+    def machine_type(self):
+        machine = self._loaded_machine
+        return machine.machine_type if machine else None
+
+    @property
+    def _loaded_machine(self):
+        # Never lazy-load from a response serializer: the instance may be
+        # detached by then, and one query per row is what eager loading avoids.
+        if "machine" in inspect(self).unloaded:
+            return None
+        return self.machine
+
     @property
     def can_be_cancelled(self) -> bool:
         """Check if order detail can be cancelled"""
@@ -324,6 +324,14 @@ class Payment(Base):
     @property
     def is_cancelled(self) -> bool:
         return self.status == PaymentStatus.CANCELLED
+
+    @property
+    def needs_provider_details(self) -> bool:
+        """Full-discount payments are settled internally, with no QR/card details"""
+        return not (
+            self.payment_method == PaymentMethod.DISCOUNT_FULL
+            and self.total_amount == 0
+        )
     
     def soft_delete(self, deleted_by: Optional[uuid.UUID] = None) -> None:
         """Soft delete the payment transaction"""
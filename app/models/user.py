@@ -16,7 +16,11 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import validates, relationship
 
 from app.libs.database import Base
-from app.utils.security.hash import get_password_hash, verify_password
+from app.utils.security.hash import (
+    get_password_hash,
+    verify_and_update_password,
+    verify_password,
+)
 
 
 class UserRole(str, Enum):
@@ -26,6 +30,12 @@ class UserRole(str, Enum):
     CUSTOMER = "CUSTOMER"
 
 
+# Role groups checked on hot paths; frozensets give hashed, allocation-free
+# membership tests.
+LMS_ROLES = frozenset({UserRole.ADMIN, UserRole.TENANT_ADMIN, UserRole.TENANT_STAFF})
+TENANT_ROLES = frozenset({UserRole.TENANT_ADMIN, UserRole.TENANT_STAFF})
+
+
 class UserStatus(str, Enum):
     NEW = "NEW"
     ACTIVE = "ACTIVE"
@@ -92,7 +102,7 @@ class User(Base):
             if not email or '@' not in email:
                 raise ValueError("Invalid email format")
             
-            if self.role in [UserRole.ADMIN, UserRole.TENANT_ADMIN, UserRole.TENANT_STAFF] and not email:
+            if self.role in LMS_ROLES and not email:
                 raise ValueError(f"Email is required for role: {self.role.value}")
         
         return email
@@ -117,7 +127,7 @@ class User(Base):
         if self.role == UserRole.CUSTOMER:
             if not self.phone:
                 raise ValueError("Phone is required as username for customer role")
-        elif self.role in [UserRole.ADMIN, UserRole.TENANT_ADMIN, UserRole.TENANT_STAFF]:
+        elif self.role in LMS_ROLES:
             if not self.email:
                 raise ValueError("Email is required as username for admin/tenant roles")
     
@@ -131,6 +141,16 @@ class User(Base):
     
     def verify_password(self, password: str) -> bool:
         return verify_password(password, self.password)
+
+    def verify_and_update_password(self, password: str) -> bool:
+        """
+        Verify the password and upgrade a deprecated hash in place; the
+        owning session persists the new hash on commit.
+        """
+        verified, new_hash = verify_and_update_password(password, self.password)
+        if new_hash:
+            self.password = new_hash
+        return verified
     
     def is_active(self) -> bool:
         return self.status == UserStatus.ACTIVE and self.deleted_at is None
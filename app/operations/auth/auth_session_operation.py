@@ -1,15 +1,19 @@
 from datetime import datetime, timedelta
 from uuid import uuid4
 
+import orjson
+from redis.exceptions import RedisError
+
+from app.core.logging import logger
 from app.enums.auth_session import AuthSessionStatusEnum
-from app.libs.cache import cache_manager
+from app.libs.cache import get_async_redis
 from app.schemas.auth_session import AuthSession
 from app.operations.auth.one_time_access_token_operation import OneTimeAccessTokenOperation
 from app.models.user import User
 
 
 class AuthSessionOperation:
-    
+
     CACHED_KEY_TEMPLATE: str = "auth_session:{session_id}"
 
     @classmethod
@@ -23,17 +27,17 @@ class AuthSessionOperation:
             expires_at=datetime.now() + timedelta(seconds=ttl_seconds),
             data=None,
         )
-        
+
         cached_key = cls.CACHED_KEY_TEMPLATE.format(session_id=session.id)
         cached_data = cls._to_cached_data(session)
-        cache_manager.set(cached_key, cached_data, session.expires_in)
+        await cls._store(cached_key, cached_data)
 
         return session
 
     @classmethod
     async def get(cls, session_id: str) -> AuthSession:
         cached_key = cls.CACHED_KEY_TEMPLATE.format(session_id=session_id)
-        cached_data = cache_manager.get(cached_key)
+        cached_data = await cls._load(cached_key)
         if not cached_data:
             raise ValueError("Session not found")
         return cls._to_session(cached_data)
@@ -41,55 +45,92 @@ class AuthSessionOperation:
     @classmethod
     async def update(cls, session_id: str, status: AuthSessionStatusEnum, data: dict) -> AuthSession | None:
         cached_key = cls.CACHED_KEY_TEMPLATE.format(session_id=session_id)
-        cached_data = cache_manager.get(cached_key)
+        cached_data = await cls._load(cached_key)
         if not cached_data:
             return None
 
         cached_data["status"] = status.value
         cached_data["data"] = data
-        cache_manager.set(cached_key, cached_data, cached_data["expires_in"])
-        
+        await cls._store(cached_key, cached_data)
+
         return cls._to_session(cached_data)
 
     @classmethod
     async def delete(cls, session_id: str) -> None:
         cached_key = cls.CACHED_KEY_TEMPLATE.format(session_id=session_id)
-        cache_manager.delete(cached_key)
+        try:
+            await get_async_redis().delete(cached_key)
+        except RedisError as e:
+            logger.error("Failed to delete auth session", key=cached_key, error=e)
 
     @classmethod
     async def mark_as_in_progress(cls, session_id: str) -> None:
         cached_key = cls.CACHED_KEY_TEMPLATE.format(session_id=session_id)
-        cached_data = cache_manager.get(cached_key)
+        cached_data = await cls._load(cached_key)
         if not cached_data:
             return None
 
         cached_data["status"] = AuthSessionStatusEnum.IN_PROGRESS.value
-        cache_manager.set(cached_key, cached_data, cached_data["expires_in"])
-        
+        await cls._store(cached_key, cached_data)
+
         return cls._to_session(cached_data)
-    
+
     @classmethod
     async def mark_as_success(cls, user: User, session_id: str) -> None:
         cached_key = cls.CACHED_KEY_TEMPLATE.format(session_id=session_id)
-        cached_data = cache_manager.get(cached_key)
+        cached_data = await cls._load(cached_key)
         if not cached_data:
             return None
 
-        temp_access_token = await OneTimeAccessTokenOperation.generate(user)
+        temp_access_token, temp_access_token_key = OneTimeAccessTokenOperation.build(user)
 
         cached_data["status"] = AuthSessionStatusEnum.SUCCESS.value
         cached_data["data"] = temp_access_token
-        
-        cache_manager.set(cached_key, cached_data, cached_data["expires_in"])
-        
+
+        # The one-time token and the session update go out in one MULTI/EXEC.
+        try:
+            async with get_async_redis().pipeline(transaction=True) as pipe:
+                pipe.set(
+                    temp_access_token_key,
+                    1,
+                    ex=OneTimeAccessTokenOperation.TTL_SECONDS,
+                )
+                pipe.set(cached_key, orjson.dumps(cached_data), ex=cached_data["expires_in"])
+                await pipe.execute()
+        except RedisError as e:
+            logger.error("Failed to store auth session", key=cached_key, error=e)
+
         return cls._to_session(cached_data)
-    
+
+    @classmethod
+    async def _load(cls, cached_key: str) -> dict | None:
+        try:
+            value = await get_async_redis().get(cached_key)
+        except RedisError as e:
+            logger.error("Failed to load auth session", key=cached_key, error=e)
+            return None
+
+        if value is None:
+            return None
+        return orjson.loads(value)
+
+    @classmethod
+    async def _store(cls, cached_key: str, cached_data: dict) -> None:
+        try:
+            await get_async_redis().set(
+                cached_key,
+                orjson.dumps(cached_data),
+                ex=cached_data["expires_in"],
+            )
+        except RedisError as e:
+            logger.error("Failed to store auth session", key=cached_key, error=e)
+
     @classmethod
     def _to_cached_data(cls, session: AuthSession) -> dict:
         data = session.model_dump()
         data["status"] = data["status"].value
         return data
-    
+
     @classmethod
     def _to_session(cls, cached_data: dict) -> AuthSession:
         data = AuthSession(**cached_data)
@@ -1,9 +1,9 @@
 from datetime import timedelta
 
 from sqlalchemy.orm import Session
-from app.libs.cache import cache_manager
+from app.libs.cache import get_async_redis
 from app.libs.database import with_db_session_classmethod
-from app.models.user import User, UserRole
+from app.models.user import User, TENANT_ROLES
 from app.models.tenant_member import TenantMember
 from app.utils.security import jwt
 
@@ -11,28 +11,42 @@ from app.utils.security import jwt
 class OneTimeAccessTokenOperation:
 
     CACHED_KEY_TEMPLATE: str = "one_time_access_token:{one_time_access_token}"
+    TTL_SECONDS: int = 300
 
     @classmethod
     async def generate(cls, user: User) -> str:
+        one_time_access_token, cached_key = cls.build(user)
+        await get_async_redis().set(cached_key, 1, ex=cls.TTL_SECONDS)
+
+        return one_time_access_token
+
+    @classmethod
+    def build(cls, user: User) -> tuple[str, str]:
+        """
+        Create a one time access token and its cache key without storing it,
+        for callers that write it together with other keys.
+        """
         payload = cls._get_payload(user)
         one_time_access_token = jwt.create_access_token(
             data=payload,
-            expires_delta=timedelta(seconds=300)
+            expires_delta=timedelta(seconds=cls.TTL_SECONDS)
         )
 
         cached_key = cls.CACHED_KEY_TEMPLATE.format(one_time_access_token=one_time_access_token)
-        cache_manager.set(cached_key, True, timedelta(seconds=300))
-
-        return one_time_access_token
+        return one_time_access_token, cached_key
 
     @classmethod
     async def generate_tokens(cls, one_time_access_token: str) -> tuple[str, str]:
         cached_key = cls.CACHED_KEY_TEMPLATE.format(one_time_access_token=one_time_access_token)
-        cached_data = cache_manager.get(cached_key)
+
+        # Read and consume the token in one MULTI/EXEC so it can only be used once.
+        async with get_async_redis().pipeline(transaction=True) as pipe:
+            pipe.get(cached_key)
+            pipe.delete(cached_key)
+            cached_data, _ = await pipe.execute()
+
         if not cached_data:
             raise ValueError("One time access token not found")
-        
-        cache_manager.delete(cached_key)
 
         user = jwt.verify_token(one_time_access_token)
         if not user:
@@ -53,7 +67,7 @@ class OneTimeAccessTokenOperation:
         payload["user_id"] = str(user.id)
         payload["is_one_time_access_token"] = True
 
-        if user.role in [UserRole.TENANT_ADMIN, UserRole.TENANT_STAFF]:
+        if user.role in TENANT_ROLES:
             tenant_member = (
                 db.query(TenantMember)
                 .filter(TenantMember.user_id == user.id)
@@ -74,7 +88,7 @@ class OneTimeAccessTokenOperation:
         # add user id
         payload["user_id"] = str(user.id)
 
-        if user.role in [UserRole.TENANT_ADMIN, UserRole.TENANT_STAFF]:
+        if user.role in TENANT_ROLES:
             tenant_member = (
                 db.query(TenantMember)
                 .filter(TenantMember.user_id == user.id)
@@ -5,7 +5,7 @@ from sqlalchemy.exc import NoResultFound
 from app.core.config import settings
 from app.libs.database import with_db_session_classmethod
 from app.models.tenant_member import TenantMember
-from app.models.user import User, UserRole
+from app.models.user import User, TENANT_ROLES
 from app.utils.security import jwt
 from app.schemas.auth import SignInRequest
 
@@ -14,7 +14,7 @@ class SignInOperation:
 
     @classmethod
     @with_db_session_classmethod
-    async def execute(cls, db: Session, request: SignInRequest) -> tuple[User, str, str]:
+    def execute(cls, db: Session, request: SignInRequest) -> tuple[User, str, str]:
         if request.email:
             user = db.query(User).filter(User.email == request.email).first()
         elif request.phone:
@@ -25,7 +25,7 @@ class SignInOperation:
         if not user:
             raise NoResultFound("User not found")
 
-        if not user.verify_password(request.password):
+        if not user.verify_and_update_password(request.password):
             raise NoResultFound("Invalid password")
 
         payload = cls.get_payload(user)
@@ -48,7 +48,7 @@ class SignInOperation:
         # add user id
         payload["user_id"] = str(user.id)
 
-        if user.role in [UserRole.TENANT_ADMIN, UserRole.TENANT_STAFF]:
+        if user.role in TENANT_ROLES:
             tenant_member = (
                 db.query(TenantMember)
                 .filter(TenantMember.user_id == user.id)
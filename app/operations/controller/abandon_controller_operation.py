@@ -1,4 +1,5 @@
 from datetime import datetime
+import time
 import uuid
 
 from sqlalchemy.orm import Session
@@ -11,14 +12,28 @@ from app.enums.mqtt import MQTTEventTypeEnum
 
 
 class AbandonControllerOperation:
-    ABANDONED_CONTROLLERS_CACHE_KEY = "abandoned_controllers"
+    # Sorted set of device ids scored by their last registration time.
+    ABANDONED_CONTROLLERS_CACHE_KEY = "abandoned:controllers"
+    ABANDONED_CONTROLLER_TTL_SECONDS = 60 * 15
     WAIT_ADMIN_ASSIGN_STORE_TOPIC = "lms/controllers/{device_id}/wait_admin_assign_store"
 
     @classmethod
-    def list(cls):
-        result = cache_manager.get(cls.ABANDONED_CONTROLLERS_CACHE_KEY)
-        if result:
-            return result
+    def list(cls, offset: int, limit: int) -> tuple[int, list[str]]:
+        redis_client = cache_manager.redis_client
+        if redis_client is None:
+            return 0, []
+
+        pipeline = redis_client.pipeline(transaction=False)
+        pipeline.zremrangebyscore(
+            cls.ABANDONED_CONTROLLERS_CACHE_KEY,
+            "-inf",
+            time.time() - cls.ABANDONED_CONTROLLER_TTL_SECONDS,
+        )
+        pipeline.zcard(cls.ABANDONED_CONTROLLERS_CACHE_KEY)
+        pipeline.zrevrange(cls.ABANDONED_CONTROLLERS_CACHE_KEY, offset, offset + limit - 1)
+        _, total, device_ids = pipeline.execute()
+
+        return total, device_ids
 
     @classmethod
     def verify(cls, device_id: str):
@@ -58,17 +73,14 @@ class AbandonControllerOperation:
         if controller and controller.store_id:
             return controller
 
-        abandon_controllers = cache_manager.get(cls.ABANDONED_CONTROLLERS_CACHE_KEY)
-        if abandon_controllers:
-            abandon_controllers = list(set(abandon_controllers + [device_id]))
-        else:
-            abandon_controllers = [device_id]
+        redis_client = cache_manager.redis_client
+        if redis_client is None:
+            return
 
-        cache_manager.set(
-            cls.ABANDONED_CONTROLLERS_CACHE_KEY,
-            abandon_controllers,
-            ttl_seconds=60 * 15,
-        )
+        pipeline = redis_client.pipeline(transaction=False)
+        pipeline.zadd(cls.ABANDONED_CONTROLLERS_CACHE_KEY, {device_id: time.time()})
+        pipeline.expire(cls.ABANDONED_CONTROLLERS_CACHE_KEY, cls.ABANDONED_CONTROLLER_TTL_SECONDS)
+        pipeline.execute()
 
     @classmethod
     def confirm_assignment(cls, controller: Controller):
@@ -92,10 +104,8 @@ class AbandonControllerOperation:
 
     @classmethod
     def remove(cls, device_id: str):
-        abandon_controllers = cache_manager.get(cls.ABANDONED_CONTROLLERS_CACHE_KEY)
-        if abandon_controllers:
-            abandon_controllers.remove(device_id)
-        else:
-            abandon_controllers = []
+        redis_client = cache_manager.redis_client
+        if redis_client is None:
+            return
 
-        cache_manager.set(cls.ABANDONED_CONTROLLERS_CACHE_KEY, abandon_controllers, ttl_seconds=60 * 15)
+        redis_client.zrem(cls.ABANDONED_CONTROLLERS_CACHE_KEY, device_id)
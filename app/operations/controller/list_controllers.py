@@ -1,6 +1,6 @@
 from typing import List
-from sqlalchemy import or_
-from sqlalchemy.orm import Session, Query
+from sqlalchemy import Select, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.controller import Controller, ControllerStatus
 from app.models.firmware import Firmware
@@ -16,7 +16,7 @@ class ListControllersOperation:
 
     def __init__(
         self, 
-        db: Session, 
+        db: AsyncSession, 
         current_user: User, 
         query_params: ListControllerQueryParams,
     ):
@@ -24,26 +24,36 @@ class ListControllersOperation:
         self.current_user = current_user
         self.query_params = query_params
 
-    def execute(self) -> tuple[int, List[Order]]:
+    async def execute(self) -> tuple[int, List[Order]]:
         base_query = self._build_base_query()
 
         base_query = self._apply_filters(base_query)
         base_query = self._apply_ordering(base_query)
 
-        total = base_query.count()
-        stores = (
-            base_query.offset(
-                (self.query_params.page - 1) * self.query_params.page_size
-            )
+        # The total rides along on every row as a window count, so the page
+        # and the count come back in one round-trip.
+        result = await self.db.execute(
+            base_query.add_columns(func.count().over().label("total"))
+            .offset((self.query_params.page - 1) * self.query_params.page_size)
             .limit(self.query_params.page_size)
-            .all()
         )
-        
+        stores = result.all()
+
+        if stores:
+            total = stores[0].total
+        elif self.query_params.page > 1:
+            # Past the last page there are no rows to carry the total.
+            total = await self.db.scalar(
+                select(func.count()).select_from(base_query.order_by(None).subquery())
+            )
+        else:
+            total = 0
+
         return total, stores
 
-    def _build_base_query(self) -> Query:
+    def _build_base_query(self) -> Select:
         base_query = (
-            self.db.query(
+            select(
                 *Controller.__table__.columns,
                 Store.id.label('store_id'),
                 Store.name.label('store_name'),
@@ -51,9 +61,10 @@ class ListControllersOperation:
                 Firmware.name.label('firmware_name'),
                 Firmware.version.label('firmware_version'),
             )
+            .select_from(Controller)
             .outerjoin(Store, Controller.store_id == Store.id)
             .outerjoin(Firmware, Controller.provisioned_firmware_id == Firmware.id)
-            .filter(
+            .where(
                 Controller.deleted_at.is_(None),
                 Controller.status.notin_([ControllerStatus.INACTIVE]),
             )
@@ -61,29 +72,27 @@ class ListControllersOperation:
 
         if self.current_user.is_tenant_admin:
             store_ids_sub_query = (
-                self.db.query(Store.id)
+                select(Store.id)
                 .join(TenantMember, Store.tenant_id == TenantMember.tenant_id)
                 .filter(
                     TenantMember.user_id == self.current_user.id,
                 )
-                .subquery()
             )
             
             base_query = base_query.filter(Controller.store_id.in_(store_ids_sub_query))
 
         elif self.current_user.is_tenant_staff:
             store_ids_sub_query = (
-                self.db.query(Store.id)
+                select(Store.id)
                 .join(StoreMember, Store.id == StoreMember.store_id)
                 .filter(StoreMember.user_id == self.current_user.id)
-                .subquery()
             )
             
             base_query = base_query.filter(Controller.store_id.in_(store_ids_sub_query))
 
         return base_query
 
-    def _apply_filters(self, base_query: Query) -> Query:
+    def _apply_filters(self, base_query: Select) -> Select:
         if self.query_params.status:
             base_query = base_query.filter(Controller.status == self.query_params.status)
 
@@ -103,7 +112,7 @@ class ListControllersOperation:
 
         return base_query
 
-    def _apply_ordering(self, base_query: Query) -> Query:
+    def _apply_ordering(self, base_query: Select) -> Select:
         if not self.query_params.order_by: return base_query
         
         if self.query_params.order_by == "store_name":
@@ -1,6 +1,7 @@
 from uuid import UUID
 from datetime import datetime, timedelta
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.libs.database import with_db_session_classmethod
@@ -50,9 +51,17 @@ class GetOverviewMachineStatusLineChartOperation:
                 "datasets": []
             }
         
+        # Date and label are formatted by PostgreSQL, and the controller is
+        # joined in, so rows map straight to chart points without per-row
+        # strftime or lazy loads of machine.controller.
         datapoints = (
-            db.query(Datapoint)
+            db.query(
+                func.to_char(Datapoint.created_at, "YYYY-MM-DD HH24:MI:SS").label("date"),
+                func.concat(Controller.device_id, " - ", Machine.relay_no).label("label"),
+                Datapoint.value.label("value"),
+            )
             .join(Machine, Datapoint.machine_id == Machine.id)
+            .join(Controller, Machine.controller_id == Controller.id)
             .filter(
                 Machine.id.in_([m.id for m in machines]),
                 Datapoint.created_at >= start_date,
@@ -62,14 +71,5 @@ class GetOverviewMachineStatusLineChartOperation:
             .order_by(Datapoint.created_at)
             .all()
         )
-        
-        data = []
-        for dp in datapoints:
-            label = f"{dp.machine.controller.device_id} - {dp.machine.relay_no}"
-            data.append({
-                "date": dp.created_at.strftime("%Y-%m-%d %H:%M:%S"),
-                "label": label,
-                "value": dp.value,
-            })
-        
-        return data
+
+        return [datapoint._asdict() for datapoint in datapoints]
@@ -1,8 +1,10 @@
 from uuid import UUID
-from sqlalchemy import or_
+from sqlalchemy import Float, cast, or_, select
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
 from app.libs.database import with_db_session_classmethod
+from app.utils.pagination import paginate_query
 from app.models.order import Order
 from app.models.payment import Payment
 from app.models.payment import PaymentStatus
@@ -15,10 +17,23 @@ class ListOverviewOrderOperation:
 
     @classmethod
     @with_db_session_classmethod
-    def execute(cls, db: Session, current_user: User, query_params: ListOverviewOrdersQueryParams) -> tuple[int, list[Order]]:
+    def execute(cls, db: Session, current_user: User, query_params: ListOverviewOrdersQueryParams) -> tuple[int, list[Row]]:
+        # Only the columns the overview table shows, already in response
+        # shape, so rows map straight to response items without building
+        # Order entities.
         base_query = (
             db.query(
-                Order,
+                Order.id,
+                Order.created_at,
+                Order.updated_at,
+                Order.deleted_at,
+                Order.created_by,
+                Order.updated_by,
+                Order.deleted_by,
+                cast(Order.total_amount, Float).label("total_amount"),
+                Order.total_washer,
+                Order.total_dryer,
+                Order.status,
                 Payment.status.label("payment_status"),
                 Payment.transaction_code.label("transaction_code"),
                 Payment.payment_method.label("payment_method"),
@@ -27,12 +42,16 @@ class ListOverviewOrderOperation:
         )
         
         if not current_user.is_admin:
-            tenant_members = db.query(TenantMember).filter(TenantMember.user_id == current_user.id).all()
-            tenant_ids = [tenant_member.tenant_id for tenant_member in tenant_members]
+            # Scoped in the same statement rather than loading the
+            # memberships first.
+            tenant_ids_sub_query = (
+                select(TenantMember.tenant_id)
+                .where(TenantMember.user_id == current_user.id)
+            )
             base_query = (
                 base_query
                 .join(Store, Order.store_id == Store.id)
-                .filter(Store.tenant_id.in_(tenant_ids))
+                .filter(Store.tenant_id.in_(tenant_ids_sub_query))
             )
 
         if query_params.status:
@@ -63,15 +82,10 @@ class ListOverviewOrderOperation:
         else:
             base_query = base_query.order_by(Order.created_at.desc())
 
-        total = base_query.count()
-        result = (
-            base_query
-            .order_by(Order.created_at.desc())
-            .offset((query_params.page - 1) * query_params.page_size)
-            .limit(query_params.page_size)
-            .all()
+        return paginate_query(
+            base_query.order_by(Order.created_at.desc()),
+            query_params.page,
+            query_params.page_size,
         )
 
-        return total, result
-
 
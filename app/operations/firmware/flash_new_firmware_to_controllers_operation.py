@@ -1,5 +1,6 @@
 from uuid import UUID
 
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
@@ -49,29 +50,42 @@ class FlashNewFirmwareToControllersOperation:
         if not controllers:
             raise ValueError("Controllers not found")
 
+        controller_ids = [controller.id for controller in controllers]
         existing_firmware_deployments = self._get_existing_firmware_deployment(
-            db, firmware.id, [controller.id for controller in controllers],
+            db, firmware.id, controller_ids,
         )
 
-        for controller in controllers:
-            if controller.id in existing_firmware_deployments:
-                deployment = existing_firmware_deployments[controller.id]
-                deployment.status = FirmwareDeploymentStatus.REBOOTING
-                db.add(deployment)
-            else:
-                deployment = FirmwareDeployment(
-                    firmware_id=firmware.id,
-                    controller_id=controller.id,
-                    status=FirmwareDeploymentStatus.NEW,
-                )
-                db.add(deployment)
-                db.flush()
-
-            self._publish_firmware_deployment(controller, firmware, deployment)
-            # TODO: remove this logic after handling another statuses
-            self._complete_firmware_deployment(db, deployment, controller)
+        # Deployments are written set-based (one INSERT ... RETURNING for the
+        # new ones, one UPDATE for the rest) and committed before publishing,
+        # so acks coming back from the controllers always find their row.
+        deployment_ids = {
+            controller_id: deployment.id
+            for controller_id, deployment in existing_firmware_deployments.items()
+        }
+        deployment_ids.update(
+            self._create_firmware_deployments(
+                db,
+                firmware.id,
+                [
+                    controller_id
+                    for controller_id in controller_ids
+                    if controller_id not in existing_firmware_deployments
+                ],
+            )
+        )
+        self._set_firmware_deployment_status(
+            db,
+            [deployment.id for deployment in existing_firmware_deployments.values()],
+            FirmwareDeploymentStatus.REBOOTING,
+        )
         db.commit()
 
+        for controller in controllers:
+            self._publish_firmware_deployment(controller, firmware, deployment_ids[controller.id])
+
+        # TODO: remove this logic after handling another statuses
+        self._complete_firmware_deployments(db, firmware.id, deployment_ids)
+
     def _get_current_user(self, db: Session, current_user_id: UUID) -> User:
         return db.get(User, current_user_id)
 
@@ -89,7 +103,7 @@ class FlashNewFirmwareToControllersOperation:
             .all()
         )
 
-    def _get_existing_firmware_deployment(self, db: Session, firmware_id: UUID, controller_ids: list[UUID]) -> FirmwareDeployment:
+    def _get_existing_firmware_deployment(self, db: Session, firmware_id: UUID, controller_ids: list[UUID]) -> dict[UUID, FirmwareDeployment]:
         deployments = (
             db.query(FirmwareDeployment)
             .filter(FirmwareDeployment.firmware_id == firmware_id)
@@ -100,14 +114,53 @@ class FlashNewFirmwareToControllersOperation:
         deployments_by_controller_id = {deployment.controller_id: deployment for deployment in deployments}
         return deployments_by_controller_id
 
+    def _create_firmware_deployments(
+        self,
+        db: Session,
+        firmware_id: UUID,
+        controller_ids: list[UUID],
+    ) -> dict[UUID, UUID]:
+        if not controller_ids:
+            return {}
+
+        rows = db.execute(
+            insert(FirmwareDeployment)
+            .values([
+                {
+                    "firmware_id": firmware_id,
+                    "controller_id": controller_id,
+                    "status": FirmwareDeploymentStatus.NEW,
+                }
+                for controller_id in controller_ids
+            ])
+            .returning(FirmwareDeployment.controller_id, FirmwareDeployment.id)
+        ).all()
+
+        return {controller_id: deployment_id for controller_id, deployment_id in rows}
+
+    def _set_firmware_deployment_status(
+        self,
+        db: Session,
+        deployment_ids: list[UUID],
+        status: FirmwareDeploymentStatus,
+    ) -> None:
+        if not deployment_ids:
+            return
+
+        db.execute(
+            update(FirmwareDeployment)
+            .where(FirmwareDeployment.id.in_(deployment_ids))
+            .values(status=status)
+        )
+
     def _publish_firmware_deployment(
         self,
         controller: Controller,
         firmware: Firmware,
-        deployment: FirmwareDeployment,
+        deployment_id: UUID,
     ) -> None:
         topic = self._get_controller_action_topic(controller)
-        payload = self._build_firmware_deployment_payload(controller, firmware, deployment)
+        payload = self._build_firmware_deployment_payload(controller, firmware, deployment_id)
 
         logger.info(f"Publishing firmware deployment to controller", topic=topic, payload=payload)
 
@@ -123,7 +176,7 @@ class FlashNewFirmwareToControllersOperation:
         self,
         controller: Controller,
         firmware: Firmware,
-        deployment: FirmwareDeployment,
+        deployment_id: UUID,
     ) -> dict:
         file_path = f"{settings.BUCKET_NAME}/{firmware.object_name}"
         file_url = self.minio_client.get_public_file_url(file_path)
@@ -133,7 +186,7 @@ class FlashNewFirmwareToControllersOperation:
             controller_id=str(controller.device_id),
             store_id=str(controller.store_id),
             payload={
-                "deployment_id": str(deployment.id),
+                "deployment_id": str(deployment_id),
                 "firmware_version": firmware.version,
                 "file_url": file_url,
                 "file_size": firmware.file_size,
@@ -143,11 +196,22 @@ class FlashNewFirmwareToControllersOperation:
 
         return payload
 
-    def _complete_firmware_deployment(self, db: Session, deployment: FirmwareDeployment, controller: Controller) -> None:
-        deployment.status = FirmwareDeploymentStatus.COMPLETED
-        db.add(deployment)
+    def _complete_firmware_deployments(
+        self,
+        db: Session,
+        firmware_id: UUID,
+        deployment_ids: dict[UUID, UUID],
+    ) -> None:
+        self._set_firmware_deployment_status(
+            db,
+            list(deployment_ids.values()),
+            FirmwareDeploymentStatus.COMPLETED,
+        )
 
-        controller.provisioned_firmware_id = deployment.firmware_id
-        db.add(controller)
+        db.execute(
+            update(Controller)
+            .where(Controller.id.in_(list(deployment_ids.keys())))
+            .values(provisioned_firmware_id=firmware_id)
+        )
 
         db.commit()
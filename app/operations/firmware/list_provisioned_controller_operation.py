@@ -3,6 +3,7 @@ from uuid import UUID
 from sqlalchemy.orm import Session
 
 from app.libs.database import with_db_session_for_class_instance
+from app.utils.pagination import paginate_query
 from app.models.firmware import Firmware
 from app.models.controller import Controller
 from app.models.store import Store
@@ -61,10 +62,7 @@ class ListProvisionedControllersOperation:
         else:
             query = query.order_by(Controller.created_at.desc())
             
-        total = query.count()
-        result = query.offset((query_params.page - 1) * query_params.page_size).limit(query_params.page_size).all()
-
-        return total, result
+        return paginate_query(query, query_params.page, query_params.page_size)
 
     def _has_permission(self, current_user: User) -> bool:
         return current_user.is_admin
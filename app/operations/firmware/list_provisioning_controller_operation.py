@@ -3,6 +3,7 @@ from uuid import UUID
 from sqlalchemy.orm import Session
 
 from app.libs.database import with_db_session_for_class_instance
+from app.utils.pagination import paginate_query
 from app.models.controller import Controller
 from app.models.user import User
 from app.models.firmware import Firmware
@@ -62,10 +63,7 @@ class ListProvisioningControllersOperation:
         else:
             base_query = base_query.order_by(Controller.created_at.desc())
             
-        total = base_query.count()
-        result = base_query.offset((self.query_params.page - 1) * self.query_params.page_size).limit(self.query_params.page_size).all()
-
-        return total, result
+        return paginate_query(base_query, self.query_params.page, self.query_params.page_size)
 
     def _validate(self):
         if not self._has_permission(self.current_user):
@@ -3,8 +3,9 @@ from decimal import Decimal
 from typing import List
 from uuid import UUID, uuid4
 
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import func, or_, update
 
 from app.core.logging import logger
 from app.enums.mqtt import MQTTEventTypeEnum
@@ -21,6 +22,7 @@ from app.schemas.machine import (
     ListMachineQueryParams,
 )
 from app.utils.coin import calculate_pulse_value
+from app.utils.pagination import paginate_list_query
 
 
 class MachineOperation:
@@ -59,7 +61,7 @@ class MachineOperation:
         db: Session,
         current_user: User,
         query_params: ListMachineQueryParams,
-    ) -> tuple[int, List[Machine]]:
+    ) -> tuple[int | None, List[Machine]]:
         base_query = (
             db.query(
                 *Machine.__table__.columns,
@@ -120,15 +122,7 @@ class MachineOperation:
                 Machine.relay_no.asc(),
             )
 
-        total = base_query.count()
-        results = (
-            base_query
-            .offset((query_params.page - 1) * query_params.page_size)
-            .limit(query_params.page_size)
-            .all()
-        )
-
-        return total, results
+        return paginate_list_query(base_query, Machine, query_params)
 
     @classmethod
     @with_db_session_classmethod
@@ -212,11 +206,17 @@ class MachineOperation:
         deleted_by: User,
         machine_id: UUID,
     ) -> bool:
-        machine = db.query(Machine).filter_by(id=machine_id).first()
-        if not machine:
+        # Same effect as Machine.soft_delete, as one conditional UPDATE.
+        deleted_id = db.execute(
+            update(Machine)
+            .where(Machine.id == machine_id, Machine.deleted_at.is_(None))
+            .values(deleted_at=func.now(), status=MachineStatus.OUT_OF_SERVICE)
+            .returning(Machine.id)
+            .execution_options(synchronize_session=False)
+        ).scalar()
+        if deleted_id is None:
             raise ValueError("Machine not found")
 
-        machine.soft_delete()
         db.commit()
 
         return True
@@ -274,16 +274,12 @@ class MachineOperation:
 
     @classmethod
     @with_db_session_classmethod
-    def activate_machine(cls, db: Session, user: User, machine_id: UUID) -> Machine:
-        machine = db.query(Machine).filter_by(id=machine_id).first()
-        if not machine:
-            raise ValueError("Machine not found")
-
-        machine.activate()
-        db.commit()
-        db.refresh(machine)
-
-        return machine
+    def activate_machine(cls, db: Session, user: User, machine_id: UUID) -> Row:
+        return cls._transition_status(
+            db,
+            [Machine.id == machine_id],
+            to_status=MachineStatus.IDLE,
+        )
 
     @classmethod
     @with_db_session_classmethod
@@ -294,26 +290,31 @@ class MachineOperation:
         machine_id: UUID,
         total_amount: Decimal = None,
         pulse_value: int = 10,
-    ) -> Machine:
-        machine = (
-            db.query(Machine).filter(
+    ) -> Row:
+        # The controller's ids ride along in RETURNING (UPDATE ... FROM
+        # controllers), so the MQTT topic needs no further query.
+        machine = cls._transition_status(
+            db,
+            [
                 Machine.id == machine_id,
                 Machine.deleted_at.is_(None),
-            ).first()
+                Machine.controller_id == Controller.id,
+            ],
+            from_status=MachineStatus.IDLE,
+            to_status=MachineStatus.STARTING,
+            error_message="Only idle machines can start operations",
+            returning=(
+                Controller.store_id.label("store_id"),
+                Controller.device_id.label("controller_device_id"),
+            ),
         )
-        if not machine:
-            raise ValueError("Machine not found")
-
-        machine.start()
-        db.commit()
-        db.refresh(machine)
         
         if total_amount:
             pulse_value = calculate_pulse_value(total_amount, machine.coin_value)
 
         topic = cls.MACHINE_ACTION_TOPIC.format(
-            store_id=str(machine.controller.store_id),
-            controller_id=str(machine.controller.device_id),
+            store_id=str(machine.store_id),
+            controller_id=str(machine.controller_device_id),
         )
 
         action_payload = {
@@ -329,8 +330,8 @@ class MachineOperation:
             "event_type": MQTTEventTypeEnum.MACHINE_START.value,
             "timestamp": datetime.now().isoformat(),
             "correlation_id": str(uuid4()),
-            "controller_id": str(machine.controller.device_id),
-            "store_id": str(machine.controller.store_id),
+            "controller_id": str(machine.controller_device_id),
+            "store_id": str(machine.store_id),
             "payload": action_payload,
         }
 
@@ -341,6 +342,8 @@ class MachineOperation:
             payload=payload,
         )
 
+        return machine
+
     @classmethod
     @with_db_session_classmethod
     def mark_as_in_progress(
@@ -348,27 +351,16 @@ class MachineOperation:
         db: Session,
         controller_device_id: str,
         machine_relay_no: int,
-    ) -> Machine:
-        machine = (
-            db.query(Machine)
-            .join(Controller, Machine.controller_id == Controller.id)
-            .filter(
-                Controller.device_id == controller_device_id,
-                Controller.deleted_at.is_(None),
-                Controller.status != ControllerStatus.INACTIVE,
-                Machine.relay_no == machine_relay_no,
-                Machine.deleted_at.is_(None),
-            )
-            .first()
+    ) -> Row:
+        machine = cls._transition_status(
+            db,
+            cls._controller_relay_filters(controller_device_id, machine_relay_no),
+            from_status=MachineStatus.STARTING,
+            to_status=MachineStatus.BUSY,
+            error_message="Only starting machines can be in progress",
         )
-        if not machine:
-            raise ValueError("Machine not found")
-
-        machine.mark_as_in_progress()
-        db.commit()
-        db.refresh(machine)
 
-        logger.info("Marked machine as in progress", machine=machine)
+        logger.info("Marked machine as in progress", machine_id=machine.id)
 
         return machine
 
@@ -379,27 +371,14 @@ class MachineOperation:
         db: Session,
         controller_device_id: str,
         machine_relay_no: int,
-    ) -> Machine:
-        machine = (
-            db.query(Machine)
-            .join(Controller, Machine.controller_id == Controller.id)
-            .filter(
-                Controller.device_id == controller_device_id,
-                Controller.deleted_at.is_(None),
-                Controller.status != ControllerStatus.INACTIVE,
-                Machine.relay_no == machine_relay_no,
-                Machine.deleted_at.is_(None),
-            )
-            .first()
+    ) -> Row:
+        return cls._transition_status(
+            db,
+            cls._controller_relay_filters(controller_device_id, machine_relay_no),
+            from_status=MachineStatus.BUSY,
+            to_status=MachineStatus.IDLE,
+            error_message="Only busy machines can finish operations",
         )
-        if not machine:
-            raise ValueError("Machine not found")
-
-        machine.finish_operation()
-        db.commit()
-        db.refresh(machine)
-
-        return machine
 
     @classmethod
     @with_db_session_classmethod
@@ -434,6 +413,57 @@ class MachineOperation:
 
         return machine
 
+    @classmethod
+    def _controller_relay_filters(cls, controller_device_id: str, machine_relay_no: int) -> list:
+        return [
+            Machine.controller_id == Controller.id,
+            Controller.device_id == controller_device_id,
+            Controller.deleted_at.is_(None),
+            Controller.status != ControllerStatus.INACTIVE,
+            Machine.relay_no == machine_relay_no,
+            Machine.deleted_at.is_(None),
+        ]
+
+    @classmethod
+    def _transition_status(
+        cls,
+        db: Session,
+        filters: list,
+        to_status: MachineStatus,
+        from_status: MachineStatus | None = None,
+        error_message: str | None = None,
+        returning: tuple = (),
+    ) -> Row:
+        """
+        Move the machine matching `filters` from `from_status` to `to_status`
+        with one conditional UPDATE ... RETURNING, instead of loading the row,
+        checking its status in Python and flushing it back. The machine is
+        only looked up again when nothing matched, to tell a missing machine
+        apart from one in the wrong state.
+        """
+        conditions = list(filters)
+        if from_status is not None:
+            conditions.append(Machine.status == from_status)
+
+        machine = db.execute(
+            update(Machine)
+            .where(*conditions)
+            .values(status=to_status)
+            .returning(*Machine.__table__.columns, *returning)
+            .execution_options(synchronize_session=False)
+        ).first()
+
+        if machine is None:
+            exists = (
+                from_status is not None
+                and db.query(Machine.id).filter(*filters).first() is not None
+            )
+            raise ValueError(error_message if exists else "Machine not found")
+
+        db.commit()
+
+        return machine
+
     @classmethod
     def _get_authorized_store_ids(cls, db: Session, current_user: User):
         if current_user.is_admin:
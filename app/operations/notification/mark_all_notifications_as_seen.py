@@ -1,8 +1,9 @@
 from uuid import UUID
 
+from sqlalchemy import func, update
 from sqlalchemy.orm import Session
 
-from app.models.notification import Notification
+from app.models.notification import Notification, NotificationStatus
 
 
 class MarkAllNotificationsAsSeenOperation:
@@ -15,8 +16,15 @@ class MarkAllNotificationsAsSeenOperation:
         self.user_id = user_id
 
     def execute(self):
-        notifications = self.db.query(Notification).filter(Notification.user_id == self.user_id).all()
-        for notification in notifications:
-            notification.mark_as_seen()
-            self.db.add(notification)
+        # One UPDATE over the user's unseen notifications instead of loading
+        # and flushing each row; already seen ones keep their seen_at.
+        self.db.execute(
+            update(Notification)
+            .where(
+                Notification.user_id == self.user_id,
+                Notification.status != NotificationStatus.SEEN,
+            )
+            .values(status=NotificationStatus.SEEN, seen_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
         self.db.commit()
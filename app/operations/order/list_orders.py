@@ -9,6 +9,7 @@ from app.models.tenant import Tenant
 from app.models.tenant_member import TenantMember
 from app.models.user import User
 from app.schemas.order import ListOrderQueryParams
+from app.utils.pagination import paginate_list_query
 
 
 class ListOrdersOperation:
@@ -23,22 +24,13 @@ class ListOrdersOperation:
         self.current_user = current_user
         self.query_params = query_params
 
-    def execute(self) -> tuple[int, List[Order]]:
+    def execute(self) -> tuple[int | None, List[Order]]:
         base_query = self._build_base_query()
 
         base_query = self._apply_filters(base_query)
         base_query = self._apply_ordering(base_query)
 
-        total = base_query.count()
-        stores = (
-            base_query.offset(
-                (self.query_params.page - 1) * self.query_params.page_size
-            )
-            .limit(self.query_params.page_size)
-            .all()
-        )
-        
-        return total, stores
+        return paginate_list_query(base_query, Order, self.query_params)
 
     def _build_base_query(self) -> Query:
         base_query = (
@@ -9,9 +9,10 @@ import uuid
 from decimal import Decimal
 from typing import Optional, List, Dict, Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import and_, func
+from sqlalchemy import and_, cast, func
+from sqlalchemy.dialects.postgresql import JSONB
 
 from app.models.order import Order, OrderStatus, OrderDetail, OrderDetailStatus
 from app.models.machine import Machine, MachineStatus, MachineType
@@ -22,6 +23,7 @@ from app.schemas.order import (
 )
 from app.libs.database import with_db_session_classmethod
 from app.libs.database import get_db_session
+from app.utils.pagination import paginate_list_query
 
 
 class OrderDetailOperation:
@@ -35,28 +37,46 @@ class OrderDetailOperation:
     @with_db_session_classmethod
     def list(
         cls, db: Session, query_params: ListOrderDetailQueryParams
-    ) -> tuple[int, List[OrderDetail]]:
-        base_query = db.query(
-            *OrderDetail.__table__.columns,
-            Machine.name.label("machine_name"),
-            Machine.machine_type.label("machine_type"),
-            Machine.relay_no.label("machine_relay_no"),
-        ).join(Machine, OrderDetail.machine_id == Machine.id)
+    ) -> tuple[int | None, List[OrderDetail]]:
+        base_query = cls._build_list_query(db)
 
         if query_params.order_id:
             base_query = base_query.filter(
                 OrderDetail.order_id == query_params.order_id
             )
 
-        total = base_query.count()
-        order_details = (
-            base_query.order_by(OrderDetail.created_at.desc())
-            .offset((query_params.page - 1) * query_params.page_size)
-            .limit(query_params.page_size)
+        base_query = base_query.order_by(OrderDetail.created_at.desc())
+
+        return paginate_list_query(base_query, OrderDetail, query_params)
+
+    @classmethod
+    @with_db_session_classmethod
+    def list_by_order_ids(
+        cls, db: Session, order_ids: List[uuid.UUID]
+    ) -> List[OrderDetail]:
+        """All details of a page of orders in one query, oldest first."""
+        if not order_ids:
+            return []
+
+        return (
+            cls._build_list_query(db)
+            .filter(OrderDetail.order_id.in_(order_ids))
+            .order_by(OrderDetail.created_at.asc())
             .all()
         )
 
-        return total, order_details
+    @classmethod
+    def _build_list_query(cls, db: Session):
+        # add_ons is stored as JSON text; casting it to jsonb hands the rows
+        # a decoded list, as OrderDetailResponse's validator would.
+        columns = [column for column in OrderDetail.__table__.columns if column.key != "add_ons"]
+        return db.query(
+            *columns,
+            cast(OrderDetail.add_ons, JSONB).label("add_ons"),
+            Machine.name.label("machine_name"),
+            Machine.machine_type.label("machine_type"),
+            Machine.relay_no.label("machine_relay_no"),
+        ).join(Machine, OrderDetail.machine_id == Machine.id)
 
     def create_order_detail(
         self,
@@ -144,6 +164,7 @@ class OrderDetailOperation:
         """
         return (
             self.db_session.query(OrderDetail)
+            .options(joinedload(OrderDetail.machine))
             .filter(and_(OrderDetail.id == detail_id, OrderDetail.deleted_at.is_(None)))
             .first()
         )
@@ -160,6 +181,7 @@ class OrderDetailOperation:
         """
         return (
             self.db_session.query(OrderDetail)
+            .options(joinedload(OrderDetail.machine))
             .filter(
                 and_(OrderDetail.order_id == order_id, OrderDetail.deleted_at.is_(None))
             )
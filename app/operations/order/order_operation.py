@@ -11,10 +11,11 @@ from decimal import Decimal
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy import and_, func, or_
 
 from app.libs.database import with_db_session_classmethod
+from app.libs.response_cache import evict_response_cache
 from app.models import ControllerStatus, Controller
 from app.models.machine import Machine, MachineStatus, MachineType
 from app.models.order import Order, OrderStatus, OrderDetail, OrderDetailStatus
@@ -27,6 +28,7 @@ from app.operations.promotion.check_and_apply_promotion_operation import (
     CheckAndApplyPromotionOperation,
 )
 from app.schemas.order import CreateOrderRequest, ListOrderQueryParams
+from app.utils.pagination import paginate_query
 
 
 class OrderOperation:
@@ -208,8 +210,13 @@ class OrderOperation:
         Returns:
             Dictionary with orders and pagination info
         """
-        query = db.query(Order).filter(
-            and_(Order.store_id == store_id, Order.deleted_at.is_(None))
+        query = (
+            db.query(Order)
+            .options(
+                selectinload(Order.store),
+                selectinload(Order.order_details).joinedload(OrderDetail.machine),
+            )
+            .filter(and_(Order.store_id == store_id, Order.deleted_at.is_(None)))
         )
 
         # Apply filters
@@ -306,14 +313,7 @@ class OrderOperation:
                     getattr(Order, query_params.order_by).asc()
                 )
 
-        result = (
-            base_query.offset((query_params.page - 1) * query_params.page_size)
-            .limit(query_params.page_size)
-            .all()
-        )
-        total = base_query.count()
-
-        return total, result
+        return paginate_query(base_query, query_params.page, query_params.page_size)
 
     @classmethod
     @with_db_session_classmethod
@@ -354,6 +354,7 @@ class OrderOperation:
 
         db.add(order)
         db.commit()
+        evict_response_cache("order")
         return order
 
     @classmethod
@@ -417,6 +418,7 @@ class OrderOperation:
         order.update_status(OrderStatus.WAITING_FOR_PAYMENT, updated_by)
         db.commit()
         db.refresh(order)
+        evict_response_cache("order")
 
         return order
 
@@ -475,23 +477,27 @@ class OrderOperation:
         ).scalar() or Decimal("0.00")
 
         # Orders by status
-        status_counts = {}
-        for status in OrderStatus:
-            count = query.filter(Order.status == status).count()
+        status_counts = {status.value: 0 for status in OrderStatus}
+        orders_by_status = (
+            query.with_entities(Order.status, func.count(Order.id))
+            .group_by(Order.status)
+            .all()
+        )
+        for status, count in orders_by_status:
             status_counts[status.value] = count
 
         # Orders by store
         store_counts = {}
         if not store_id:  # Only if not filtering by specific store
             store_orders = (
-                query.with_entities(Order.store_id, func.count(Order.id))
-                .group_by(Order.store_id)
+                query.outerjoin(Store, Order.store_id == Store.id)
+                .with_entities(Order.store_id, Store.name, func.count(Order.id))
+                .group_by(Order.store_id, Store.name)
                 .all()
             )
 
-            for store_id_val, count in store_orders:
-                store = db.query(Store).filter(Store.id == store_id_val).first()
-                store_name = store.name if store else f"Store {store_id_val}"
+            for store_id_val, store_name, count in store_orders:
+                store_name = store_name or f"Store {store_id_val}"
                 store_counts[store_name] = count
 
         # Machine usage
@@ -603,7 +609,9 @@ class OrderOperation:
     ) -> None:
         """Start machines for an order."""
         order_details = (
-            db.query(OrderDetail).filter(
+            db.query(OrderDetail)
+            .options(joinedload(OrderDetail.machine))
+            .filter(
                 OrderDetail.order_id == order_id,
                 OrderDetail.deleted_at.is_(None),
             ).all()
@@ -628,7 +636,10 @@ class OrderOperation:
     ) -> None:
         """Finish machines for an order."""
         order_details = (
-            db.query(OrderDetail).filter(OrderDetail.order_id == order_id).all()
+            db.query(OrderDetail)
+            .options(joinedload(OrderDetail.machine))
+            .filter(OrderDetail.order_id == order_id)
+            .all()
         )
 
         """Finish machines for an order."""
@@ -646,7 +657,10 @@ class OrderOperation:
     ) -> None:
         """Cancel machines for an order."""
         order_details = (
-            db.query(OrderDetail).filter(OrderDetail.order_id == order_id).all()
+            db.query(OrderDetail)
+            .options(joinedload(OrderDetail.machine))
+            .filter(OrderDetail.order_id == order_id)
+            .all()
         )
 
         """Cancel machines for an order."""
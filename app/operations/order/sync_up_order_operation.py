@@ -2,7 +2,7 @@ from typing import List
 import uuid
 
 import sqlalchemy as sa
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager
 
 from app.core.logging import logger
 from app.libs.database import with_db_session_classmethod
@@ -71,6 +71,7 @@ class SyncUpOrderOperation:
     def __sync_up_in_progress(cls, db: Session, order: Order):
         order_details = (
             db.query(OrderDetail).join(Machine, OrderDetail.machine_id == Machine.id)
+            .options(contains_eager(OrderDetail.machine))
             .filter(OrderDetail.order_id == order.id)
             .all()
         )
@@ -1,10 +1,12 @@
 from datetime import datetime, timezone, timedelta
 from uuid import UUID
 
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from app.enums.vnpay import VNPAYMethodCodeEnum
 from app.libs.database import with_db_session_for_class_instance
+from app.libs.response_cache import evict_response_cache
 from app.libs.vnpay import CardPayment
 from app.models.payment import Payment, PaymentMethod, PaymentStatus, PaymentProvider
 from app.models.store import Store
@@ -16,19 +18,24 @@ class GeneratePaymentDetailsOperation:
         self.payment_id = payment_id
 
         self._preload()
-        self._validate()
 
     @with_db_session_for_class_instance
     def execute(self, db: Session):
-        if (
-            self.payment.payment_method == PaymentMethod.DISCOUNT_FULL
-            and self.payment.total_amount == 0
-        ):
+        if not self.payment.needs_provider_details:
             return
 
-        self.payment.status = PaymentStatus.WAITING_FOR_PAYMENT_DETAIL
-        db.add(self.payment)
+        # Claim the payment: only one run can move it out of NEW, so a
+        # retried or duplicated task finds nothing to claim and stops
+        # without generating the details twice.
+        claimed = db.execute(
+            update(Payment)
+            .where(Payment.id == self.payment.id, Payment.status == PaymentStatus.NEW)
+            .values(status=PaymentStatus.WAITING_FOR_PAYMENT_DETAIL)
+            .execution_options(synchronize_session=False)
+        ).rowcount
         db.commit()
+        if not claimed:
+            return
 
         transaction_id, details = self._get_payment_details()
 
@@ -38,6 +45,8 @@ class GeneratePaymentDetailsOperation:
         db.add(self.payment)
         db.commit()
         db.refresh(self.payment)
+        # Clients poll GET /payment/{id} for the details.
+        evict_response_cache("payment")
 
         return self.payment
 
@@ -50,15 +59,6 @@ class GeneratePaymentDetailsOperation:
         self.order = self.payment.order
         self.store = self.payment.store
 
-    def _validate(self):        
-        if self.payment.payment_method == PaymentMethod.DISCOUNT_FULL and self.payment.total_amount == 0:
-            return
-
-        if self.payment.status != PaymentStatus.NEW:
-            raise ValueError(
-                f"Payment {self.payment.id} cannot generate details in status {self.payment.status.value}"
-            )
-
     def _get_payment(self, db: Session):
         return db.query(Payment).filter(Payment.id == self.payment_id).first()
 
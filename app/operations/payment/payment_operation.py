@@ -22,6 +22,7 @@ from app.models.store import Store
 from app.models.tenant import Tenant
 from app.schemas.payment import InitializePaymentRequest
 from app.libs.database import with_db_session_classmethod
+from app.libs.response_cache import evict_response_cache
 from app.services.payment_service import PaymentService, PaymentProviderEnum
 from app.operations.order.order_operation import OrderOperation
 
@@ -511,8 +512,10 @@ class PaymentOperation:
                 )
 
             db.add(payment)
+            # Sessions keep their state on commit, so the new status is
+            # already on the instance; no refresh SELECT is needed.
             db.commit()
-            db.refresh(payment)
+            evict_response_cache("payment")
 
             return {
                 "payment_id": str(payment.id),
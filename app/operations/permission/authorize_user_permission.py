@@ -1,17 +1,48 @@
+from typing import Iterable
+
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.libs.database import with_db_session_classmethod
-from app.models.user import User
-from app.operations.permission.get_user_permissions import GetUserPermissionsOperation
+from app.models.permission import Permission
+from app.models.user import User, UserRole
+from app.operations.permission.get_user_permissions import (
+    TENANT_ADMIN_EXCLUDED_PERMISSIONS,
+    TENANT_STAFF_EXCLUDED_PERMISSIONS,
+)
+
+
+EXCLUDED_PERMISSIONS_BY_ROLE = {
+    UserRole.TENANT_ADMIN: frozenset(TENANT_ADMIN_EXCLUDED_PERMISSIONS),
+    UserRole.TENANT_STAFF: frozenset(TENANT_STAFF_EXCLUDED_PERMISSIONS),
+}
 
 
 class AuthorizeUserPermissionOperation:
-    
+
     @with_db_session_classmethod
-    def execute(self, db: Session, user: User, permissions: list[str]) -> bool:
-        # TODO: Add cache logic
-        user_permissions = GetUserPermissionsOperation().execute(db, user)
+    def execute(self, db: Session, user: User, permissions: Iterable[str]) -> bool:
+        # Same rules as GetUserPermissionsOperation, but only the requested
+        # codes are checked, in a single COUNT, instead of loading every
+        # permission the user has. frozenset() of a frozenset is a no-op.
+        required_permissions = frozenset(permissions)
+        if not required_permissions:
+            return True
+
+        if user.role == UserRole.CUSTOMER:
+            return False
+
+        excluded_permissions = EXCLUDED_PERMISSIONS_BY_ROLE.get(user.role)
+        if excluded_permissions and not required_permissions.isdisjoint(excluded_permissions):
+            return False
 
-        is_authorized = all(permission in user_permissions for permission in permissions)
+        total_enabled = (
+            db.query(func.count(Permission.id))
+            .filter(
+                Permission.is_enabled == True,
+                Permission.code.in_(required_permissions),
+            )
+            .scalar()
+        )
 
-        return is_authorized
+        return total_enabled == len(required_permissions)
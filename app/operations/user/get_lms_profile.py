@@ -1,4 +1,5 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.tenant import Tenant
 from app.models.tenant_member import TenantMember
@@ -6,17 +7,17 @@ from app.models.user import User
 
 class GetLMSProfileOperation:
     def __init__(
-        self, db: Session, current_user: User
+        self, db: AsyncSession, current_user: User
     ):
         self.db = db
         self.current_user = current_user
 
-    def execute(self) -> tuple[User, Tenant]:
-        tenant = (
-            self.db.query(Tenant)
+    async def execute(self) -> tuple[User, Tenant]:
+        tenant = await self.db.scalar(
+            select(Tenant)
             .join(TenantMember, Tenant.id == TenantMember.tenant_id)
-            .filter(TenantMember.user_id == self.current_user.id)
-            .first()
+            .where(TenantMember.user_id == self.current_user.id)
+            .limit(1)
         )
 
         if not tenant:
@@ -2,6 +2,7 @@ from sqlalchemy.orm import Session
 
 from app.libs.database import with_db_session_classmethod
 from app.models.user import User
+from app.utils.security.session_cache import UserSessionCache
 from app.schemas.user import (
     CreateUserRequest,
     UpdateUserRequest,
@@ -74,6 +75,7 @@ class UserOperation:
 
         db.commit()
         db.refresh(user)
+        UserSessionCache.invalidate_user(user.id)
 
         return user
     
@@ -96,6 +98,7 @@ class UserOperation:
         user.set_password(request.password)
         db.commit()
         db.refresh(user)
+        UserSessionCache.invalidate_user(user.id)
 
         return user
 
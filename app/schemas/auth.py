@@ -1,5 +1,5 @@
 from uuid import UUID
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Any
 
 from app.enums.auth import OTPActionEnum
@@ -9,12 +9,16 @@ from app.schemas.tenant import TenantSerializer
 
 
 class RegisterLMSUserRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     email: str
     password: str
     role: UserRole
 
 
 class SignInRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     email: str | None = None
     phone: str | None = None
     password: str
@@ -27,6 +31,8 @@ class SignInResponse(BaseModel):
 
 
 class RefreshTokenRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     refresh_token: str
 
 
@@ -36,6 +42,8 @@ class RefreshTokenResponse(BaseModel):
 
 
 class SendOTPRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     action: OTPActionEnum
     data: Any | None = {}
 
@@ -47,6 +55,8 @@ class SendOTPResponse(BaseModel):
 
 
 class VerifyOTPRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     otp: str
     action: OTPActionEnum
     session_id: str | None = None
@@ -58,10 +68,14 @@ class LMSProfileResponse(BaseModel):
 
 
 class GenerateTokenByOneTimeAccessTokenRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     one_time_access_token: str
 
 
 class VerifyStoreConfigurationAccessRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     tenant_id: UUID
 
 
@@ -1,5 +1,5 @@
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from uuid import UUID
 
 from app.models.controller import ControllerStatus
@@ -23,6 +23,8 @@ class ControllerSerializer(BaseModel):
 
 
 class AddControllerRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     device_id: str
     name: str | None = None
     store_id: UUID | None = None
@@ -31,6 +33,8 @@ class AddControllerRequest(BaseModel):
 
 
 class UpdateControllerRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str | None = None
     store_id: UUID | None = None
     total_relays: int | None = None
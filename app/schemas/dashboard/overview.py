@@ -75,6 +75,26 @@ class OverviewRevenueByDayBarChartResponse(BaseModel):
     values: List[float]
 
 
+class OverviewDashboardQueryParams(BaseModel):
+    tenant_id: UUID
+    store_id: UUID | None = None
+    start_date: datetime | None = None
+    end_date: datetime | None = None
+
+    @validator('start_date', 'end_date', pre=True)
+    def convert_to_utc(cls, v):
+        """Convert datetime to UTC. If timezone-naive, assume it's in Vietnam timezone."""
+        if v is None:
+            return None
+        return to_utc(v)
+
+
+class OverviewDashboardResponse(BaseModel):
+    key_metrics: OverviewKeyMetricsResponse
+    order_by_day: OverviewOrderByDayBarChartResponse
+    revenue_by_day: OverviewRevenueByDayBarChartResponse
+
+
 class StoreKeyMetricsResponse(BaseModel):
     id: UUID
     name: str
@@ -5,7 +5,7 @@ from pydantic import BaseModel, Field
 from uuid import UUID
 
 from app.models.machine import MachineType, MachineStatus
-from app.schemas.pagination import Pagination
+from app.schemas.pagination import KeysetPagination
 
 
 class MachineSerializer(BaseModel):
@@ -53,7 +53,7 @@ class UpdateMachineRequest(BaseModel):
     add_ons_options: List[Dict[str, Any]] | None = None
 
 
-class ListMachineQueryParams(Pagination):
+class ListMachineQueryParams(KeysetPagination):
     search: str | None = None
     order_by: str | None = "created_at"
     order_direction: str | None = "asc"
@@ -10,7 +10,7 @@ from pydantic import BaseModel, Field, validator, root_validator
 from app.models.order import OrderStatus, OrderDetailStatus, AddOnType
 from app.models.machine import MachineType
 from app.models.payment import PaymentStatus
-from app.schemas.pagination import Pagination
+from app.schemas.pagination import KeysetPagination
 
 
 class AddOnItem(BaseModel):
@@ -89,7 +89,7 @@ class UpdateOrderDetailStatusRequest(BaseModel):
         return v
 
 
-class ListOrderDetailQueryParams(Pagination):
+class ListOrderDetailQueryParams(KeysetPagination):
     order_id: Optional[UUID] = None
 
 
@@ -149,6 +149,11 @@ class OrderResponse(BaseModel):
         from_attributes = True
 
 
+class OrderWithDetailsResponse(OrderResponse):
+    """Schema for an order listed with include_details"""
+    order_details: Optional[List[OrderDetailResponse]] = None
+
+
 class OrderDetailListResponse(BaseModel):
     """Schema for order detail list response"""
     order_details: List[OrderDetailResponse]
@@ -266,7 +271,7 @@ class OrderCompletionRequest(BaseModel):
         return v
 
 
-class ListOrderQueryParams(Pagination):
+class ListOrderQueryParams(KeysetPagination):
     tenant_id: Optional[UUID] = None
     store_ids: Optional[list[UUID]] = None
     status: Optional[OrderStatus] = None
@@ -276,3 +281,4 @@ class ListOrderQueryParams(Pagination):
     query: Optional[str] = None
     order_by: Optional[str] = None
     order_direction: Optional[str] = None
+    include_details: bool = False
@@ -1,5 +1,6 @@
 import math
-from typing import TypeVar, Generic, List
+from typing import TypeVar, Generic, List, Literal
+from uuid import UUID
 from pydantic import BaseModel, Field
 
 T = TypeVar('T')
@@ -11,14 +12,31 @@ class Pagination(BaseModel):
     page_size: int = Field(default=10, ge=1, le=100, description="Number of items per page")
 
 
+class KeysetPagination(Pagination):
+    """Pagination parameters for list endpoints that can also page by keyset"""
+    pagination: Literal["offset", "keyset"] = Field(
+        default="offset",
+        description="keyset pages newest first by (created_at, id) and never counts",
+    )
+    after: UUID | None = Field(default=None, description="Keyset mode: return items after this ID")
+    omit_total: bool = Field(default=False, description="Offset mode: skip counting the total")
+
+
 class PaginatedResponse(BaseModel, Generic[T]):
     """Generic paginated response schema"""
     page: int
     page_size: int
-    total: int
-    total_pages: int
+    total: int | None = None
+    total_pages: int | None = None
     data: List[T]
     
     class Config:
         # This allows the generic type to be properly serialized
         arbitrary_types_allowed = True
+
+
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    """Generic keyset paginated response schema"""
+    page_size: int
+    next_cursor: UUID | None = None
+    data: List[T]
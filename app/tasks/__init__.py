@@ -4,11 +4,13 @@ from app.tasks.payment.payment_tasks import (
     generate_payment_details,
     sync_payment_transaction,
 )
+from app.tasks.payment.generate_payment_details_task import generate_payment_details_task
 from app.tasks.payment.sync_up_timeout_payments_task import sync_up_timeout_payments_task
 
 from app.tasks.auth.send_otp_task import send_otp_task
 
 from app.tasks.order.sync_up_in_progress_orders_task import sync_up_in_progress_orders_task
+from app.tasks.order.sync_up_order_task import sync_up_order_task
 
 from app.tasks.promotion.sync_up_promotion_campaign_task import sync_up_promotion_campaign_task
 
@@ -31,6 +33,7 @@ __all__ = [
     # Payment tasks
     "generate_payment_details",
     "sync_payment_transaction",
+    "generate_payment_details_task",
     "sync_up_timeout_payments_task",
 
     # Auth tasks
@@ -38,6 +41,7 @@ __all__ = [
 
     # Order tasks
     "sync_up_in_progress_orders_task",
+    "sync_up_order_task",
 
     # Promotion tasks
     "sync_up_promotion_campaign_task",
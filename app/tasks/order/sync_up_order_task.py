@@ -0,0 +1,18 @@
+from uuid import UUID
+
+from app.core.celery_app import celery_app
+from app.core.logging import logger
+from app.operations.order.sync_up_order_operation import SyncUpOrderOperation
+
+
+@celery_app.task(name="app.tasks.order.sync_up_order_task")
+def sync_up_order_task(order_id: UUID):
+    logger.info("Syncing up order", order_id=order_id)
+
+    try:
+        SyncUpOrderOperation.execute(order_id)
+    except Exception as e:
+        logger.error(f"Error syncing up order: {str(e)}", order_id=order_id)
+        raise e
+
+    logger.info("Order synced up", order_id=order_id)
@@ -0,0 +1,21 @@
+from uuid import UUID
+
+from app.core.celery_app import celery_app
+from app.core.logging import logger
+from app.operations.payment.generate_payment_details_operation import GeneratePaymentDetailsOperation
+
+
+@celery_app.task(name="app.tasks.payment.generate_payment_details_task")
+def generate_payment_details_task(payment_id: UUID):
+    logger.info("Generating payment details", payment_id=payment_id)
+
+    try:
+        # kombu's json serializer round-trips UUIDs, so payment_id arrives
+        # as one already.
+        operation = GeneratePaymentDetailsOperation(payment_id)
+        operation.execute()
+    except Exception as e:
+        logger.error(f"Error generating payment details: {str(e)}", payment_id=payment_id)
+        raise e
+
+    logger.info("Payment details generated", payment_id=payment_id)
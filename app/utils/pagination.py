@@ -1,5 +1,111 @@
-import math
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.orm import Query, aliased
+
+from app.schemas.pagination import KeysetPagination
 
 
 def get_total_pages(total: int, page_size: int) -> int:
-    return math.ceil(total / page_size)
+    # Integer ceiling division. Cheaper than an lru_cache lookup, so it is
+    # not memoised.
+    return -(-total // page_size)
+
+
+def paginate_query(query: Query, page: int, page_size: int) -> tuple[int, list[Any]]:
+    """
+    Fetch one page of `query` together with the total number of matches.
+
+    The total rides along on every row as COUNT(*) OVER (), so the page and
+    the count come back in one round-trip instead of a COUNT query that
+    re-runs the whole join. A separate count only runs when a page past the
+    end comes back empty.
+    """
+    is_single_entity = len(query.column_descriptions) == 1
+
+    rows = (
+        query.add_columns(func.count().over().label("total"))
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+        .all()
+    )
+
+    if rows:
+        total = rows[0].total
+    elif page > 1:
+        total = query.order_by(None).count()
+    else:
+        total = 0
+
+    if is_single_entity:
+        rows = [row[0] for row in rows]
+
+    return total, rows
+
+
+def keyset_paginate_query(query: Query, model: Any, after: Optional[UUID], page_size: int) -> list[Any]:
+    """
+    Fetch the page of `query` that follows the row `after`, newest first by
+    (created_at, id). The page is found by seeking the (created_at, id)
+    index instead of reading and discarding OFFSET rows, and nothing is
+    counted.
+    """
+    query = query.order_by(None).order_by(model.created_at.desc(), model.id.desc())
+
+    if after is not None:
+        cursor_row = aliased(model)
+        cursor = (
+            select(cursor_row.created_at, cursor_row.id)
+            .where(cursor_row.id == after)
+            .scalar_subquery()
+        )
+        query = query.filter(tuple_(model.created_at, model.id) < cursor)
+
+    return query.limit(page_size).all()
+
+
+def paginate_list_query(query: Query, model: Any, query_params: KeysetPagination) -> tuple[Optional[int], list[Any]]:
+    """
+    Page `query` the way `query_params` asks for. The total is None when it
+    is not counted: in keyset mode, or when the caller passed omit_total.
+    Otherwise it comes from the same round-trip as the page, see
+    paginate_query.
+    """
+    if query_params.pagination == "keyset":
+        return None, keyset_paginate_query(query, model, query_params.after, query_params.page_size)
+
+    if query_params.omit_total:
+        rows = (
+            query
+            .offset((query_params.page - 1) * query_params.page_size)
+            .limit(query_params.page_size)
+            .all()
+        )
+        return None, rows
+
+    return paginate_query(query, query_params.page, query_params.page_size)
+
+
+def build_paginated_response(query_params: KeysetPagination, total: Optional[int], data: list[dict]) -> dict:
+    """
+    Wrap one page of serialized rows in the response shape for its mode. In
+    keyset mode a full page carries the ID of its last row as next_cursor.
+    """
+    if query_params.pagination == "keyset":
+        is_full_page = len(data) == query_params.page_size
+        return {
+            "page_size": query_params.page_size,
+            "next_cursor": data[-1]["id"] if is_full_page else None,
+            "data": data,
+        }
+
+    page_size = query_params.page_size
+    return {
+        "page": query_params.page,
+        "page_size": page_size,
+        "total": total,
+        # get_total_pages inlined, this runs on every list request.
+        "total_pages": -(-total // page_size) if total is not None else None,
+        "data": data,
+    }
@@ -0,0 +1,68 @@
+import hashlib
+from decimal import Decimal
+from typing import Any, Iterable
+
+import orjson
+from fastapi import Request
+from fastapi.responses import ORJSONResponse as BaseORJSONResponse, Response
+from pydantic import BaseModel
+from sqlalchemy.engine import Row
+
+
+def _default(obj: Any) -> Any:
+    # orjson handles UUID, datetime and enums natively; Decimal is the one
+    # column type left, rendered as a string the way pydantic does.
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError
+
+
+# Timestamp columns are timezone-aware; UTC_Z renders them the way pydantic
+# does ("...Z") and NAIVE_UTC covers any naive value left over.
+_OPTIONS = (
+    orjson.OPT_NAIVE_UTC
+    | orjson.OPT_UTC_Z
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_SERIALIZE_NUMPY
+)
+
+
+class ORJSONResponse(BaseORJSONResponse):
+    """ORJSONResponse that can render raw query rows (Decimal included)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=_OPTIONS)
+
+
+class PydanticResponse(Response):
+    """Render a schema instance with its compiled pydantic-core serializer."""
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.__pydantic_serializer__.to_json(content)
+
+
+def serialize_rows(rows: Iterable[Row], serializer: type[BaseModel]) -> list[dict]:
+    """
+    Project query rows onto the fields of a response schema without
+    validating them, so list endpoints can skip a model per row.
+    """
+    fields = tuple(serializer.model_fields)
+    return [{field: row._mapping[field] for field in fields} for row in rows]
+
+
+def etag_response(request: Request, content: Any) -> Response:
+    """
+    Render `content` through ORJSONResponse tagged with an ETag of its body.
+    Clients revalidating with a matching If-None-Match get an empty 304.
+    """
+    response = ORJSONResponse(content)
+    etag = f'"{hashlib.blake2b(response.body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return response
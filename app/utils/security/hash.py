@@ -1,11 +1,21 @@
 from passlib.context import CryptContext
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# New hashes use argon2id (OWASP minimum parameters), which the C-backed
+# argon2-cffi verifies several times faster than bcrypt at cost 12. bcrypt
+# stays listed so existing hashes still verify; they are marked deprecated
+# and rehashed on the next successful sign-in.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__memory_cost=19456,
+    argon2__time_cost=2,
+    argon2__parallelism=1,
+)
 
 
 def hash_password(password: str) -> str:
-    """Hash a password using bcrypt.
+    """Hash a password using argon2.
     
     Args:
         password: Plain text password
@@ -17,7 +27,7 @@ def hash_password(password: str) -> str:
 
 
 def get_password_hash(password: str) -> str:
-    """Hash a password using bcrypt (alias for hash_password).
+    """Hash a password using argon2 (alias for hash_password).
     
     Args:
         password: Plain text password
@@ -39,3 +49,18 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         True if password matches, False otherwise
     """
     return pwd_context.verify(plain_password, hashed_password)
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """Verify a password and rehash it if its scheme is deprecated.
+    
+    Args:
+        plain_password: Plain text password
+        hashed_password: Hashed password to verify against
+        
+    Returns:
+        Whether the password matches, and the new hash to store (or None)
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
@@ -1,7 +1,8 @@
 from datetime import datetime, timedelta, timezone
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import NoResultFound
-from jose import jwt
+from jose import jwk, jwt
+from jose.constants import ALGORITHMS
 from typing import Optional, Any
 
 from app.core.config import settings
@@ -9,6 +10,22 @@ from app.models.user import User
 from app.libs.database import with_db_session
 
 
+def _load_verification_algorithms() -> list[str]:
+    if settings.JWT_ALGORITHM not in ALGORITHMS.SUPPORTED:
+        raise ValueError(f"Unsupported JWT algorithm: {settings.JWT_ALGORITHM}")
+    return [settings.JWT_ALGORITHM]
+
+
+# Resolved once at import so every encode and decode reuses the same
+# validated config. Passing a prebuilt key object spares jose from re-parsing
+# the secret and constructing a new key on every call; with cryptography
+# installed it is backed by OpenSSL's HMAC.
+VERIFICATION_ALGORITHMS = _load_verification_algorithms()
+VERIFICATION_KEY = jwk.construct(settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
+SIGNING_KEY = VERIFICATION_KEY
+DECODE_OPTIONS = {"require_exp": True}
+
+
 def create_access_token(
     data: dict,
     expires_delta: Optional[timedelta] = None,
@@ -24,7 +41,7 @@ def create_access_token(
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.JWT_SECRET_KEY,
+        SIGNING_KEY,
         algorithm=settings.JWT_ALGORITHM
     )
     return encoded_jwt
@@ -44,38 +61,42 @@ def create_refresh_token(
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.JWT_SECRET_KEY,
+        SIGNING_KEY,
         algorithm=settings.JWT_ALGORITHM
     )
     return encoded_jwt 
 
 
+def decode_token(token: str) -> dict:
+    return jwt.decode(
+        token,
+        VERIFICATION_KEY,
+        algorithms=VERIFICATION_ALGORITHMS,
+        options=DECODE_OPTIONS,
+    )
+
+
+def find_user_by_token_payload(db: Session, payload: dict) -> User:
+    user_id = payload.get("user_id")
+    user = db.query(User).filter(User.id == user_id).first()
+    if not user:
+        raise NoResultFound("Invalid token")
+
+    return user
+
+
 @with_db_session
-def verify_token(db: Session, token: str) -> Optional[User]:
-    try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
-        
-        user_id = payload.get("user_id")
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            raise NoResultFound("Invalid token")
+def get_user_by_token_payload(db: Session, payload: dict) -> User:
+    return find_user_by_token_payload(db, payload)
 
-        return user
-    except Exception as e:  
-        raise e
+
+def verify_token(token: str) -> Optional[User]:
+    return get_user_by_token_payload(decode_token(token))
 
 
 def verify_vietqr_internal_user(token: str) -> Optional[Any]:
     try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = decode_token(token)
 
         username = payload.get("username")
         if username != settings.VIETQR_PARTNER_USERNAME:
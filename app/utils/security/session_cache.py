@@ -0,0 +1,96 @@
+import hashlib
+import json
+import time
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from app.core.logging import logger
+from app.libs.cache import cache_manager
+from app.models.user import User
+
+
+class UserSessionCache:
+    """
+    Redis cache of the user behind a verified access token, shared by every
+    API worker. Entries live until the token expires, and all entries of a
+    user can be dropped at once (e.g. after a password change).
+    """
+
+    KEY_TEMPLATE: str = "sess:{token_hash}"
+    USER_INDEX_KEY_TEMPLATE: str = "sess:user:{user_id}"
+
+    DATETIME_FIELDS = ("created_at", "updated_at", "deleted_at", "verified_at")
+
+    @classmethod
+    def get(cls, token: str) -> Optional[tuple[User, Optional[int]]]:
+        redis_client = cache_manager.redis_client
+        if redis_client is None:
+            return None
+
+        try:
+            cached = redis_client.get(cls._build_key(token))
+        except Exception as e:
+            logger.warning("Failed to read user session cache", error=str(e))
+            return None
+
+        if cached is None:
+            return None
+
+        data = json.loads(cached)
+        return cls._load_user(data["user"]), data["exp"]
+
+    @classmethod
+    def set(cls, token: str, user: User, expires_at: Optional[int]) -> None:
+        redis_client = cache_manager.redis_client
+        if redis_client is None or expires_at is None:
+            return
+
+        ttl_seconds = int(expires_at - time.time())
+        if ttl_seconds <= 0:
+            return
+
+        key = cls._build_key(token)
+        index_key = cls.USER_INDEX_KEY_TEMPLATE.format(user_id=user.id)
+        value = json.dumps({"user": cls._dump_user(user), "exp": expires_at})
+        try:
+            pipeline = redis_client.pipeline(transaction=False)
+            pipeline.setex(key, ttl_seconds, value)
+            pipeline.sadd(index_key, key)
+            # Tokens share one lifetime, so the newest session outlives the rest.
+            pipeline.expire(index_key, ttl_seconds)
+            pipeline.execute()
+        except Exception as e:
+            logger.warning("Failed to write user session cache", error=str(e))
+
+    @classmethod
+    def invalidate_user(cls, user_id: uuid.UUID) -> None:
+        redis_client = cache_manager.redis_client
+        if redis_client is None:
+            return
+
+        index_key = cls.USER_INDEX_KEY_TEMPLATE.format(user_id=user_id)
+        try:
+            keys = redis_client.smembers(index_key)
+            redis_client.delete(index_key, *keys)
+        except Exception as e:
+            logger.warning("Failed to invalidate user session cache", error=str(e))
+
+    @classmethod
+    def _build_key(cls, token: str) -> str:
+        token_hash = hashlib.blake2b(token.encode(), digest_size=32).hexdigest()
+        return cls.KEY_TEMPLATE.format(token_hash=token_hash)
+
+    @classmethod
+    def _dump_user(cls, user: User) -> dict:
+        # to_dict() leaves out the password hash, which is never cached.
+        return user.to_dict()
+
+    @classmethod
+    def _load_user(cls, data: dict) -> User:
+        data = dict(data)
+        data["id"] = uuid.UUID(data["id"])
+        for field in cls.DATETIME_FIELDS:
+            if data.get(field):
+                data[field] = datetime.fromisoformat(data[field])
+        return User(**data)
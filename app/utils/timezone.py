@@ -1,9 +1,11 @@
+import functools
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 
 from app.core.config import settings
 
 
+@functools.lru_cache(maxsize=1)
 def get_tzinfo() -> ZoneInfo:
     return ZoneInfo(settings.TIMEZONE_NAME)
 
@@ -45,3 +47,13 @@ def to_local(dt: datetime) -> datetime:
     # Convert to local timezone
     local_tz = get_tzinfo()
     return dt.astimezone(local_tz)
+
+
+def month_to_date_utc() -> tuple[datetime, datetime]:
+    """
+    Return the start of the current local month and the current time,
+    both converted to UTC.
+    """
+    now = datetime.now(get_tzinfo())
+    month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    return to_utc(month_start), to_utc(now)
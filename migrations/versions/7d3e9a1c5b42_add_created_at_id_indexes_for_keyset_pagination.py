@@ -0,0 +1,32 @@
+"""add_created_at_id_indexes_for_keyset_pagination
+
+Revision ID: 7d3e9a1c5b42
+Revises: 4c4745368099
+Create Date: 2026-10-18 11:30:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '7d3e9a1c5b42'
+down_revision = '4c4745368099'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Built concurrently so that the tables stay writable while they build.
+    with op.get_context().autocommit_block():
+        op.create_index('ix_orders_created_at_id', 'orders', ['created_at', 'id'], postgresql_concurrently=True)
+        op.create_index(
+            'ix_order_details_created_at_id', 'order_details', ['created_at', 'id'], postgresql_concurrently=True
+        )
+        op.create_index('ix_machines_created_at_id', 'machines', ['created_at', 'id'], postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_machines_created_at_id', 'machines', postgresql_concurrently=True)
+        op.drop_index('ix_order_details_created_at_id', 'order_details', postgresql_concurrently=True)
+        op.drop_index('ix_orders_created_at_id', 'orders', postgresql_concurrently=True)
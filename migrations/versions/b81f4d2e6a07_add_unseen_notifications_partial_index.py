@@ -0,0 +1,37 @@
+"""add_unseen_notifications_partial_index
+
+Revision ID: b81f4d2e6a07
+Revises: 7d3e9a1c5b42
+Create Date: 2026-10-18 12:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b81f4d2e6a07'
+down_revision = '7d3e9a1c5b42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Built concurrently so that notifications stay writable while it builds.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_notifications_user_id_unseen',
+            'notifications',
+            ['user_id'],
+            postgresql_where=sa.text("status <> 'SEEN'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_notifications_user_id_unseen',
+            'notifications',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,35 @@
+"""add_orders_store_status_created_at_index
+
+Revision ID: e2a9c6f1d384
+Revises: b81f4d2e6a07
+Create Date: 2026-10-18 14:30:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2a9c6f1d384'
+down_revision = 'b81f4d2e6a07'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Built concurrently so that orders stay writable while it builds.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_orders_store_id_status_created_at',
+            'orders',
+            ['store_id', 'status', 'created_at'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_orders_store_id_status_created_at',
+            'orders',
+            postgresql_concurrently=True,
+        )
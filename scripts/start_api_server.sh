@@ -1,2 +1,2 @@
 #!/bin/sh
-uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload
+uvicorn app.main:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools --reload